@@ -4,40 +4,93 @@ Flask application for generating thought leadership articles for Forbes, Entrepr
 """
 
 import os
-import json
+import gzip
+import queue
+import atexit
+import re
 import uuid
 import base64
-import tempfile
+import random
 import secrets
+import threading
+import time
+import hashlib
+import hmac
 from datetime import datetime
 from pathlib import Path
-from functools import wraps
-
+from html import escape as escape_html
+from functools import wraps, lru_cache
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import orjson
+import markdown
+from lxml import etree
 import requests as http_requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from flask import Flask, request, jsonify, send_from_directory, redirect, session, url_for, Response
-from flask_cors import CORS
-from authlib.integrations.flask_client import OAuth
+from flask import Flask, request, jsonify, send_from_directory, redirect, session, url_for, Response, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.middleware.proxy_fix import ProxyFix
+from google.api_core.exceptions import NotFound, PreconditionFailed
+from jinja2 import Template
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-# Initialize Flask app
-app = Flask(__name__, static_folder='static')
-CORS(app)
+# Initialize Flask app. static/ is served by serve_static() below, which sets
+# the cache headers, so Flask's own static route is not registered.
+app = Flask(__name__, static_folder=None)
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """jsonify() and request.get_json() backed by orjson"""
+
+    def dumps(self, obj, **kwargs) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            # Types orjson doesn't know fall back to Flask's encoder
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps(obj), mimetype=self.mimetype)
+
+
+app.json = ORJSONProvider(app)
 
-# Initialize GCS for drafts and saved topics
+# GCS for drafts and saved topics. The client is created on first use rather
+# than at import: credential discovery talks to the metadata server and the
+# storage library is slow to import, both of which sat on the cold-start path.
 GCS_BUCKET_NAME = 'ceo-article-generator-drafts'
-SAVED_TOPICS_BLOB = 'saved-topics/topics.json'
-gcs_client = None
-try:
-    from google.cloud import storage as gcs_storage
-    gcs_client = gcs_storage.Client()
-    print("[OK] GCS initialized")
-except Exception as e:
-    print(f"[WARNING] GCS not available: {e}")
+SAVED_TOPICS_BLOB = 'saved-topics/topics.json'  # legacy all-publications blob
+SAVED_TOPICS_PREFIX = 'saved-topics/by-publication/'
+SAVED_TOPICS_MIGRATED_BLOB = 'saved-topics/by-publication.migrated'  # written once the split is done
+_gcs_bucket = None
+_gcs_initialized = False
+_gcs_lock = threading.Lock()
+
+def get_gcs_bucket():
+    """Return the drafts bucket, initializing GCS on first call. None if GCS is unavailable."""
+    global _gcs_bucket, _gcs_initialized
+    if _gcs_initialized:
+        return _gcs_bucket
+    with _gcs_lock:
+        if not _gcs_initialized:
+            try:
+                from google.cloud import storage as gcs_storage
+                _gcs_bucket = gcs_storage.Client().bucket(GCS_BUCKET_NAME)
+                print("[OK] GCS initialized")
+            except Exception as e:
+                print(f"[WARNING] GCS not available: {e}")
+            _gcs_initialized = True
+    return _gcs_bucket
 
 # Fix for running behind Cloud Run's proxy - ensures correct HTTPS URLs
 app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
@@ -45,19 +98,61 @@ app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
 # Session configuration
 app.secret_key = os.environ.get('FLASK_SECRET_KEY', secrets.token_hex(32))
 
-# OAuth configuration
-oauth = OAuth(app)
-google = oauth.register(
-    name='google',
-    client_id=os.environ.get('GOOGLE_CLIENT_ID'),
-    client_secret=os.environ.get('GOOGLE_CLIENT_SECRET'),
-    server_metadata_url='https://accounts.google.com/.well-known/openid-configuration',
-    client_kwargs={'scope': 'openid email profile'}
-)
+# Server-side sessions when a Redis instance is configured, so the cookie only
+# carries a session id; otherwise Flask's signed cookie sessions.
+REDIS_URL = os.environ.get('REDIS_URL')
+redis_client = None
+if REDIS_URL:
+    import redis
+    from flask_session import Session
+    redis_client = redis.from_url(REDIS_URL)
+    app.config.update(
+        SESSION_TYPE='redis',
+        SESSION_REDIS=redis_client,
+        SESSION_PERMANENT=False,
+    )
+    Session(app)
+
+# OAuth configuration. authlib is only needed by the /auth/* routes, so the
+# client is registered on the first login instead of at import.
+_google_oauth = None
+_oauth_lock = threading.Lock()
+
+def get_google_oauth():
+    """Return the Google OAuth client, registering it on first use"""
+    global _google_oauth
+    if _google_oauth is None:
+        with _oauth_lock:
+            if _google_oauth is None:
+                from authlib.integrations.flask_client import OAuth
+                oauth = OAuth(app)
+                _google_oauth = oauth.register(
+                    name='google',
+                    client_id=os.environ.get('GOOGLE_CLIENT_ID'),
+                    client_secret=os.environ.get('GOOGLE_CLIENT_SECRET'),
+                    server_metadata_url='https://accounts.google.com/.well-known/openid-configuration',
+                    client_kwargs={'scope': 'openid email profile'}
+                )
+    return _google_oauth
 
 # Allowed email domain
 ALLOWED_DOMAIN = 'brite.co'
 
+# Shown when someone signs in with an outside account; only the email changes
+_ACCESS_DENIED_PAGE = f'''
+            <html>
+            <head><title>Access Denied</title></head>
+            <body style="font-family: system-ui; display: flex; justify-content: center; align-items: center; height: 100vh; margin: 0; background: linear-gradient(135deg, #018181 0%, #272d3f 100%); color: white;">
+                <div style="text-align: center; padding: 40px; background: rgba(0,0,0,0.3); border-radius: 12px;">
+                    <h1>Access Denied</h1>
+                    <p>Only @{ALLOWED_DOMAIN} email addresses are allowed.</p>
+                    <p style="color: #a0aec0;">You signed in with: {{email}}</p>
+                    <a href="/auth/logout" style="color: #00E5E5;">Try a different account</a>
+                </div>
+            </body>
+            </html>
+            '''
+
 def login_required(f):
     """Decorator to require authentication"""
     @wraps(f)
@@ -86,6 +181,9 @@ def require_authenticated_session():
     """Gate the API behind the same Google session that protects the page.
     The browser sends the session cookie automatically on same-origin /api calls,
     so the app itself is unaffected; only anonymous callers are blocked."""
+    if request.method == 'OPTIONS':
+        # CORS preflight; add_cors_headers() fills in the response
+        return '', 204
     path = request.path
     if path in _PUBLIC_EXACT or path.startswith(_PUBLIC_PREFIXES):
         return None
@@ -93,6 +191,40 @@ def require_authenticated_session():
         return jsonify({'error': 'Authentication required'}), 401
     return None
 
+
+@app.after_request
+def add_cors_headers(response):
+    """Same open CORS policy flask-cors applied, without its per-request
+    option resolution: any origin, no credentials."""
+    if 'Origin' in request.headers:
+        response.headers['Access-Control-Allow-Origin'] = '*'
+        if request.method == 'OPTIONS':
+            response.headers['Access-Control-Allow-Methods'] = 'GET, POST, PUT, PATCH, DELETE, OPTIONS'
+            requested = request.headers.get('Access-Control-Request-Headers')
+            if requested:
+                response.headers['Access-Control-Allow-Headers'] = requested
+    return response
+
+# Drafts and the draft/completed lists carry whole articles and compress
+# several-fold; Cloud Run doesn't compress responses for us.
+GZIP_MIN_SIZE = 500
+
+@app.after_request
+def gzip_json_response(response):
+    """Gzip buffered JSON responses for clients that accept it"""
+    if (response.mimetype != 'application/json' or response.direct_passthrough
+            or 'Content-Encoding' in response.headers):
+        return response
+    response.vary.add('Accept-Encoding')
+    if 'gzip' not in request.accept_encodings:
+        return response
+    body = response.get_data()
+    if len(body) < GZIP_MIN_SIZE:
+        return response
+    response.set_data(gzip.compress(body, compresslevel=6))
+    response.headers['Content-Encoding'] = 'gzip'
+    return response
+
 # ===================
 # Configuration
 # ===================
@@ -118,6 +250,35 @@ FOLDER_IDS = {
     }
 }
 
+# Frontend publication IDs -> topic archive keys
+ARCHIVE_KEYS = {
+    'forbes': 'forbes',
+    'entrepreneur': 'entrepreneur',
+    'fastcompany': 'fast_company'
+}
+
+# Publication-specific lines in the article and rewrite prompts
+_NO_SERIAL_COMMA_RULE = "- PUNCTUATION OVERRIDE: Do NOT use the serial comma for this publication (e.g., 'apples, oranges and bananas' NOT 'apples, oranges, and bananas'). Do NOT link to Forbes, Fast Company, or Inc. (competitors)."
+ARTICLE_EXTRA_RULES = {
+    'entrepreneur': "- Do NOT include Key Takeaways bullets — Entrepreneur editors add those on their end.\n"
+                    "        " + _NO_SERIAL_COMMA_RULE
+}
+REWRITE_EXTRA_RULES = {
+    'entrepreneur': _NO_SERIAL_COMMA_RULE
+}
+
+# AI API keys
+OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
+ANTHROPIC_API_KEY = os.environ.get('ANTHROPIC_API_KEY')
+PERPLEXITY_API_KEY = os.environ.get('PERPLEXITY_API_KEY')
+
+# SendGrid
+SENDGRID_API_KEY = os.environ.get('SENDGRID_API_KEY')
+SENDGRID_FROM = (
+    os.environ.get('SENDGRID_FROM_EMAIL', 'marketing@brite.co'),
+    os.environ.get('SENDGRID_FROM_NAME', 'BriteCo CEO Articles')
+)
+
 # Email recipients
 DRAFT_RECIPIENTS = os.environ.get('DRAFT_RECIPIENTS', 'dylanne.crugnale@brite.co').split(',')
 FINAL_RECIPIENTS = os.environ.get('FINAL_RECIPIENTS', 'dylanne.crugnale@brite.co').split(',')
@@ -125,54 +286,105 @@ FINAL_RECIPIENTS = os.environ.get('FINAL_RECIPIENTS', 'dylanne.crugnale@brite.co
 # ClickUp Integration
 CLICKUP_API_TOKEN = os.environ.get('CLICKUP_API_TOKEN')
 CLICKUP_LIST_ID = os.environ.get('CLICKUP_LIST_ID')
+CLICKUP_API_BASE = "https://api.clickup.com/api/v2"
+CLICKUP_HEADERS = {'Authorization': CLICKUP_API_TOKEN or '', 'Content-Type': 'application/json'}
+# Signing secret ClickUp issues for the webhook (GET /team/{team_id}/webhook
+# lists it); deliveries are only verified when it's set
+CLICKUP_WEBHOOK_SECRET = os.environ.get('CLICKUP_WEBHOOK_SECRET', '')
+if not CLICKUP_WEBHOOK_SECRET:
+    print("[WARNING] CLICKUP_WEBHOOK_SECRET not set - ClickUp webhook signatures are not verified")
 
 # Todoist Integration
 TODOIST_API_TOKEN = os.environ.get('TODOIST_API_TOKEN', '')
 TODOIST_PROJECT_ID = os.environ.get('TODOIST_PROJECT_ID', '')
+TODOIST_TASKS_URL = 'https://api.todoist.com/api/v1/tasks'
+TODOIST_HEADERS = {'Authorization': f'Bearer {TODOIST_API_TOKEN}', 'Content-Type': 'application/json'}
+
+# Shared HTTP session for ClickUp/Todoist calls: reuses keep-alive TLS
+# connections instead of a fresh handshake per call, and retries 429/5xx
+# responses (idempotent methods only; POSTs are never replayed).
+http_session = http_requests.Session()
+http_session.mount('https://', HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                      raise_on_status=False)
+))
+
+# Shared worker threads for blocking I/O that a request fans out: GCS
+# downloads for the list views, per-recipient email sends, and the Drive
+# sharing call that overlaps the Docs content write. Tasks on it must not
+# wait on other tasks submitted to it.
+io_pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix='io')
+
+# Set the GCS bucket up in the background as the worker starts, so the first
+# webhook or list request finds it ready without import blocking on it
+io_pool.submit(get_gcs_bucket)
 
 # ===================
 # Helper Functions
 # ===================
 
+# Parsed config files keyed by path, with the st_mtime_ns they were read at.
+# One stat() per load tells us whether the file changed, so an edited guide is
+# picked up without a restart. Callers must treat returned objects as
+# read-only.
+_config_files = {}
+
+def read_config_file(filepath: Path, parse=None):
+    """Return a config file's text (or parse(bytes) result), None if missing.
+    The file is only re-read when its mtime changes."""
+    try:
+        mtime = filepath.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = _config_files.get(filepath)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    data = filepath.read_bytes()
+    value = parse(data) if parse else data.decode('utf-8')
+    _config_files[filepath] = (mtime, value)
+    return value
+
+@lru_cache(maxsize=64)
+def pub_key_for(publication) -> str:
+    """Normalized publication key, e.g. 'Fast Company' -> 'fastcompany'"""
+    return (publication or '').lower().replace(' ', '')
+
 def load_style_guide(publication: str) -> dict:
     """Load style guide JSON for a publication"""
-    filename = f"{publication.lower().replace(' ', '')}_style.json"
-    filepath = STYLE_GUIDES_DIR / filename
-    if filepath.exists():
-        with open(filepath, 'r') as f:
-            return json.load(f)
-    return {}
+    filename = f"{pub_key_for(publication)}_style.json"
+    return read_config_file(STYLE_GUIDES_DIR / filename, orjson.loads) or {}
 
 def load_brand_guide() -> str:
     """Load BriteCo brand editorial guide (applies to all publications)"""
-    filepath = STYLE_GUIDES_DIR.parent / 'briteco_brand_guide.txt'
-    if filepath.exists():
-        with open(filepath, 'r') as f:
-            return f.read()
-    return ''
+    return read_config_file(STYLE_GUIDES_DIR.parent / 'briteco_brand_guide.txt') or ''
 
 def load_voice_dna() -> str:
     """Load Dustin's Voice DNA guide (lowest-priority background voice reference)"""
-    filepath = STYLE_GUIDES_DIR.parent / 'voice_dna.md'
-    if filepath.exists():
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return f.read()
-    return ''
+    return read_config_file(STYLE_GUIDES_DIR.parent / 'voice_dna.md') or ''
 
 def load_article_examples(publication: str) -> str:
     """Load real published article examples for few-shot prompting"""
-    filename = f"{publication.lower().replace(' ', '')}_examples.txt"
-    filepath = CONFIG_DIR / 'article_examples' / filename
-    if filepath.exists():
-        with open(filepath, 'r') as f:
-            return f.read()
-    return ''
-
-def build_article_system_prompt(publication: str, style_guide: dict, brand_guide: str) -> str:
-    """Build the system prompt for article generation (voice, rules, examples)"""
+    filename = f"{pub_key_for(publication)}_examples.txt"
+    return read_config_file(CONFIG_DIR / 'article_examples' / filename) or ''
+
+# Assembled system prompt per publication, with the inputs it was built from
+_article_system_prompts = {}
+
+def build_article_system_prompt(publication: str) -> str:
+    """Build the system prompt for article generation (voice, rules, examples).
+    Rebuilt only when one of the underlying config files has changed."""
+    style_guide = load_style_guide(publication)
+    brand_guide = load_brand_guide()
     examples = load_article_examples(publication)
     voice_dna = load_voice_dna()
 
+    inputs = (style_guide, brand_guide, examples, voice_dna)
+    cached = _article_system_prompts.get(publication)
+    if cached is not None and cached[0] == inputs:
+        return cached[1]
+
     system_prompt = f"""You are a ghostwriter for Dustin Lemick, CEO and founder of BriteCo, an insurtech company providing specialty jewelry and watch insurance. You write thought leadership articles for {style_guide.get('publication_full_name', publication)}.
 
 YOUR VOICE: First person as Dustin Lemick. Conversational, confident, grounded in real experience. You sound like a founder talking to peers, not a consultant writing a white paper.
@@ -225,106 +437,494 @@ The examples teach voice and structure. These rules govern punctuation, vocabula
 
 {voice_dna}"""
 
+    _article_system_prompts[publication] = (inputs, system_prompt)
     return system_prompt
 
+# Style-guide values the prompts embed (word counts, tone, pre-formatted JSON
+# snippets), plus the compiled headline check refine_topic uses. Derived once
+# per parsed guide and reused for as long as load_style_guide() returns the
+# same object, so building a prompt is just string interpolation.
+_prompt_facts = {}
+
+def headline_format_tokens(fmt: str) -> list:
+    """A style-guide headline format split into placeholders ("[Topic]"),
+    literal words and punctuation. A "+ Question" tail becomes a placeholder
+    that must end in "?"; any other "+ ..." tail is a plain placeholder."""
+    fmt = re.sub(r'\s*\+\s*Question\b', ' [more]?', fmt)
+    fmt = re.sub(r'\s*\+\s*(?:\[[^\]]*\]|\w+)', ' [more]', fmt)
+    return [token for token in re.split(r'(\[[^\]]*\]|\s+)', fmt) if token]
+
+def headline_format_regex(fmt: str) -> str:
+    """Regex for a style-guide headline format such as "Why [Topic] Isn't/Is
+    [Insight]": placeholders match any text, "A/B" matches either word and a
+    bare X matches a number."""
+    parts = []
+    for token in headline_format_tokens(fmt):
+        if token.startswith('['):
+            parts.append('.+?')
+        elif token.isspace():
+            parts.append(r'\s+')
+        elif token == 'X':
+            parts.append(r'\d+')
+        elif '/' in token:
+            parts.append('(?:' + '|'.join(map(re.escape, token.split('/'))) + ')')
+        else:
+            parts.append(re.escape(token))
+    return ''.join(parts)
+
+def headline_format_is_specific(fmt: str) -> bool:
+    """Whether the format has literal words past its first one. "How [Topic]
+    + Question" says little more than "starts with How", so a match against
+    it doesn't show the headline was written to the guide."""
+    literals = [token for token in headline_format_tokens(fmt)
+                if not token.startswith('[') and not token.isspace()]
+    if literals and not fmt.startswith('['):
+        literals = literals[1:]
+    return any(any(char.isalpha() for char in token) for token in literals)
+
+# Words title case leaves lowercase mid-headline
+_TITLE_CASE_MINOR_WORDS = frozenset(
+    'a an and as at but by for from in into is nor of on or so than the to via with yet'.split())
+_HEADLINE_WORD_RE = re.compile(r"[^\W\d_][\w'\u2019-]*")
+
+def is_title_case(headline: str) -> bool:
+    """Whether every word but the minor ones starts with a capital"""
+    for i, token in enumerate(headline.split()):
+        word = _HEADLINE_WORD_RE.search(token)
+        if word and word[0][0].islower() and (i == 0 or word[0].lower() not in _TITLE_CASE_MINOR_WORDS):
+            return False
+    return True
+
+def compile_headline_check(style_guide: dict):
+    """(regex, min_words, max_words, title_case) for headlines that already
+    follow the guide's specific patterns, sample lengths and capitalization
+    (title case when every sample headline uses it, else sentence case), or
+    None if the guide has none of those patterns or no samples"""
+    formats = [p.get('format', '') if isinstance(p, dict) else p
+               for p in style_guide.get('headline_patterns', [])]
+    formats = [f for f in formats if f and headline_format_is_specific(f)]
+    samples = style_guide.get('sample_headlines', [])
+    if not formats or not samples:
+        return None
+    alternatives = '|'.join(f'(?:{headline_format_regex(f)})' for f in formats)
+    regex = re.compile(f'(?:{alternatives})[.?!]?')
+    lengths = [len(h.split()) for h in samples]
+    return regex, min(lengths), max(lengths), all(map(is_title_case, samples))
+
+def headline_fits(check: tuple, headline: str) -> bool:
+    """Whether headline passes a compile_headline_check() check"""
+    regex, min_words, max_words, title_case = check
+    if not regex.fullmatch(headline) or not min_words <= count_words(headline) <= max_words:
+        return False
+    if title_case:
+        return is_title_case(headline)
+    return headline[:1].isupper()
+
+def indented_json(value) -> str:
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode('utf-8')
+
+def publication_prompt_facts(publication: str) -> dict:
+    """The style-guide-derived pieces of a publication's prompts"""
+    style_guide = load_style_guide(publication)
+    cached = _prompt_facts.get(publication)
+    if cached is not None and cached[0] is style_guide:
+        return cached[1]
+
+    word_count = style_guide.get('specifications', {}).get('word_count', {})
+    facts = {
+        'full_name': style_guide.get('publication_full_name', publication),
+        'word_min': word_count.get('min', 700),
+        'word_max': word_count.get('max', 800),
+        'tone': ', '.join(style_guide.get('tone', {}).get('primary', ['professional'])),
+        'headline_patterns': indented_json(style_guide.get('headline_patterns', [])),
+        'structure': indented_json(style_guide.get('article_formats', [{}])[0].get('structure', {})),
+        'subheading_examples': indented_json(style_guide.get('subheading_patterns', {}).get('examples', [])[:5]),
+        'all_caps_subheadings': publication.lower() == 'fastcompany',
+        'article_rules': ARTICLE_EXTRA_RULES.get(publication.lower(), ''),
+        'rewrite_rules': REWRITE_EXTRA_RULES.get(publication.lower(), ''),
+        'headline_check': compile_headline_check(style_guide),
+    }
+    _prompt_facts[publication] = (style_guide, facts)
+    return facts
+
 def load_topic_archive() -> dict:
     """Load the topic archive"""
-    filepath = CONFIG_DIR / 'topic_archive.json'
-    if filepath.exists():
-        with open(filepath, 'r') as f:
-            return json.load(f)
-    return {}
+    return read_config_file(CONFIG_DIR / 'topic_archive.json', orjson.loads) or {}
+
+def clear_config_caches():
+    """Drop all cached config so the next request re-reads from disk"""
+    _config_files.clear()
+    _article_system_prompts.clear()
+    _prompt_facts.clear()
+
+# Claude models by cost/latency tier. Articles, rewrites and briefs get the
+# best model; short structured answers don't need it.
+MODEL_TIERS = {
+    'fast': "claude-haiku-4-5",
+    'balanced': "claude-sonnet-4-5",
+    'best': "claude-opus-4-8"
+}
+
+# The SDK clients are thread-safe and pool their HTTP connections, so each is
+# built once and shared by every request. httpx drops idle connections after
+# 5s by default, shorter than the gap between a user's clicks, so most calls
+# would pay a fresh TCP + TLS handshake; keep them for a couple of minutes.
+LLM_KEEPALIVE_SECONDS = 120
+
+def llm_http_client(sdk):
+    """The SDK's default httpx client with longer-lived idle connections"""
+    import httpx
+    return sdk.DefaultHttpxClient(limits=httpx.Limits(
+        max_connections=1000, max_keepalive_connections=100,
+        keepalive_expiry=LLM_KEEPALIVE_SECONDS))
 
+@lru_cache(maxsize=None)
 def get_openai_client():
     """Get OpenAI client"""
-    from openai import OpenAI
-    return OpenAI(api_key=os.environ.get('OPENAI_API_KEY'))
+    import openai
+    return openai.OpenAI(api_key=OPENAI_API_KEY, http_client=llm_http_client(openai))
 
+@lru_cache(maxsize=None)
 def get_anthropic_client():
     """Get Anthropic client"""
-    from anthropic import Anthropic
-    return Anthropic(api_key=os.environ.get('ANTHROPIC_API_KEY'))
+    import anthropic
+    return anthropic.Anthropic(api_key=ANTHROPIC_API_KEY, http_client=llm_http_client(anthropic))
 
+@lru_cache(maxsize=None)
+def get_sendgrid_client():
+    """Get SendGrid client"""
+    import sendgrid
+    return sendgrid.SendGridAPIClient(api_key=SENDGRID_API_KEY)
+
+@lru_cache(maxsize=None)
 def get_perplexity_client():
     """Get Perplexity client (uses OpenAI SDK)"""
-    from openai import OpenAI
-    return OpenAI(
-        api_key=os.environ.get('PERPLEXITY_API_KEY'),
-        base_url="https://api.perplexity.ai"
+    import openai
+    return openai.OpenAI(
+        api_key=PERPLEXITY_API_KEY,
+        base_url="https://api.perplexity.ai",
+        http_client=llm_http_client(openai)
+    )
+
+def cacheable_text(text: str) -> list:
+    """Wrap static prompt text as an Anthropic content block marked for prompt
+    caching, so repeat calls with the same prefix skip re-processing it"""
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+def log_llm_usage(label: str, response) -> None:
+    """Log token usage, including prompt-cache reads/writes, for an Anthropic
+    (or OpenAI-style chat completion) response"""
+    usage = getattr(response, 'usage', None)
+    if not usage:
+        return
+    input_tokens = getattr(usage, 'input_tokens', None) or getattr(usage, 'prompt_tokens', 0)
+    output_tokens = getattr(usage, 'output_tokens', None) or getattr(usage, 'completion_tokens', 0)
+    print(f"[LLM] {label}: input={input_tokens} output={output_tokens} "
+          f"cache_read={getattr(usage, 'cache_read_input_tokens', 0) or 0} "
+          f"cache_write={getattr(usage, 'cache_creation_input_tokens', 0) or 0}")
+
+# Answers for requests that should come back the same when repeated: trend
+# research for a month, and the brief/talking points for a given topic.
+# Entries are keyed on a hash of the full request and kept in memory and in
+# GCS (llm-cache/) so every instance shares them. Endpoints meant to give
+# fresh options on each click (topics, variations, refinements) don't use it.
+# Concurrent misses on the same key share one upstream call, so a burst of
+# users opening the same month pays for the research once.
+LLM_CACHE_TTL = 24 * 60 * 60
+LLM_CACHE_PREFIX = 'llm-cache/'
+_LLM_CACHE_MAX_ENTRIES = 256
+_llm_cache = {}  # key -> (expires_at, result)
+_llm_inflight = {}  # key -> Event set when the leading request finishes
+_llm_inflight_lock = threading.Lock()
+
+def llm_response_text(response) -> str:
+    """Text of an Anthropic message or an OpenAI-style chat completion"""
+    if hasattr(response, 'choices'):
+        return response.choices[0].message.content
+    return response.content[0].text
+
+def cached_llm_call(label: str, create, extract=llm_response_text, **request_kwargs):
+    """Return extract(create(**request_kwargs)), reusing the result of an
+    identical request made within LLM_CACHE_TTL. extract must return
+    something JSON-serializable."""
+    key = hashlib.sha256(orjson.dumps(
+        {'label': label, 'request': request_kwargs}, option=orjson.OPT_SORT_KEYS
+    )).hexdigest()
+    now = time.time()
+
+    cached = _llm_cache.get(key)
+    if cached and cached[0] > now:
+        print(f"[LLM] {label}: memory cache hit")
+        return cached[1]
+
+    with _llm_inflight_lock:
+        pending = _llm_inflight.get(key)
+        if pending is None:
+            _llm_inflight[key] = threading.Event()
+    if pending is not None:
+        pending.wait()
+        cached = _llm_cache.get(key)
+        if cached:
+            print(f"[LLM] {label}: shared in-flight result")
+            return cached[1]
+        # The leading request failed; make our own attempt
+        return _fetch_llm_result(key, label, create, extract, now, request_kwargs)
+
+    try:
+        return _fetch_llm_result(key, label, create, extract, now, request_kwargs)
+    finally:
+        with _llm_inflight_lock:
+            _llm_inflight.pop(key).set()
+
+def _fetch_llm_result(key: str, label: str, create, extract, now: float, request_kwargs: dict):
+    bucket = get_gcs_bucket()
+    if bucket is not None:
+        try:
+            entry = orjson.loads(bucket.blob(f"{LLM_CACHE_PREFIX}{key}.json").download_as_bytes())
+            if entry['created_at'] + LLM_CACHE_TTL > now:
+                print(f"[LLM] {label}: GCS cache hit")
+                _remember_llm_result(key, entry['created_at'] + LLM_CACHE_TTL, entry['result'])
+                return entry['result']
+        except NotFound:
+            pass
+        except Exception as e:
+            print(f"[WARNING] LLM cache read failed: {e}")
+
+    response = create(**request_kwargs)
+    log_llm_usage(label, response)
+    result = extract(response)
+    _remember_llm_result(key, now + LLM_CACHE_TTL, result)
+
+    if bucket is not None:
+        try:
+            bucket.blob(f"{LLM_CACHE_PREFIX}{key}.json").upload_from_string(
+                orjson.dumps({'label': label, 'created_at': now, 'result': result}),
+                content_type='application/json')
+        except Exception as e:
+            print(f"[WARNING] LLM cache write failed: {e}")
+    return result
+
+def _remember_llm_result(key: str, expires_at: float, result) -> None:
+    if len(_llm_cache) >= _LLM_CACHE_MAX_ENTRIES:
+        # Dicts keep insertion order, so this drops the oldest entry
+        _llm_cache.pop(next(iter(_llm_cache)), None)
+    _llm_cache[key] = (expires_at, result)
+
+# Structured output for the topic endpoints. Forcing Claude to answer through
+# a tool returns schema-shaped JSON directly, with no prose or code fences to
+# pay for or parse around.
+_TOPIC_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "headline": {"type": "string"},
+        "angle": {"type": "string"},
+        "timeliness": {"type": "string"},
+        "briteco_connection": {"type": "string"}
+    },
+    "required": ["headline", "angle", "timeliness", "briteco_connection"]
+}
+
+EMIT_TOPICS_TOOL = {
+    "name": "emit_topics",
+    "description": "Return the list of article topic ideas.",
+    "input_schema": {
+        "type": "object",
+        "properties": {"topics": {"type": "array", "items": _TOPIC_SCHEMA}},
+        "required": ["topics"]
+    }
+}
+
+EMIT_TOPIC_TOOL = {
+    "name": "emit_topic",
+    "description": "Return the refined article topic.",
+    "input_schema": _TOPIC_SCHEMA
+}
+
+EMIT_TALKING_POINTS_TOOL = {
+    "name": "emit_talking_points",
+    "description": "Return the talking points and questions.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "talking_points": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "type": {"type": "string", "enum": ["talking_point", "question"]},
+                        "text": {"type": "string"}
+                    },
+                    "required": ["type", "text"]
+                }
+            }
+        },
+        "required": ["talking_points"]
+    }
+}
+
+def forced_tool(tool: dict) -> dict:
+    """messages.create() arguments that make Claude answer through this tool"""
+    return {'tools': [tool], 'tool_choice': {'type': 'tool', 'name': tool['name']}}
+
+def tool_input(response) -> dict:
+    """Arguments of the tool call in an Anthropic response ({} if none)"""
+    for block in response.content:
+        if block.type == 'tool_use':
+            return block.input
+    return {}
+
+def claude_tool_call(label: str, content, tool: dict, max_tokens: int,
+                     tier: str = 'best', cached: bool = False) -> dict:
+    """Send a single-message prompt that Claude must answer through tool and
+    return the tool input. cached=True goes through cached_llm_call()."""
+    client = get_anthropic_client()
+    request_kwargs = dict(
+        model=MODEL_TIERS[tier],
+        max_tokens=max_tokens,
+        messages=[{"role": "user", "content": content}],
+        **forced_tool(tool)
     )
+    if cached:
+        return cached_llm_call(label, client.messages.create, extract=tool_input, **request_kwargs)
+    response = client.messages.create(**request_kwargs)
+    log_llm_usage(label, response)
+    return tool_input(response)
+
+# Overused LLM filler words/phrases and their plain-language replacements.
+# Keys are lowercase; matching is case-insensitive and the replacement keeps
+# the capitalization of the matched text.
+_SANITIZE_MAP = {
+    'delve': 'explore',
+    'delves': 'explore',
+    'delved': 'explore',
+    'delving': 'exploring',
+    "in today's rapidly evolving landscape": 'today',
+    "in today's rapidly evolving world": 'today',
+    "in today's rapidly changing landscape": 'today',
+    "in today's rapidly changing world": 'today',
+    "in today's landscape": 'today',
+    "in today's world": 'today',
+    "in today's environment": 'today',
+    "in today's climate": 'today',
+    'rapidly evolving landscape': 'changing market',
+    'ever-evolving landscape': 'shifting market',
+    'ever-changing landscape': 'shifting market',
+    'the landscape of': 'the world of',
+    'navigate the landscape': 'work through the challenges',
+    'navigate the complex landscape': 'work through the challenges',
+    'pivotal': 'important',
+    'crucial': 'important',
+    'moreover': 'also',
+    'furthermore': 'also',
+    'additionally': 'also',
+    'indeed': 'really',
+    'multifaceted': 'complex',
+    'tapestry': 'mix',
+    'unlock the potential': 'get the most out',
+    'unlock the full potential': 'get the most out',
+    'unlocking the potential': 'get the most out',
+    'unlocking the full potential': 'get the most out',
+    'paradigm shift': 'big change',
+    'paradigm': 'model',
+    'synergy': 'teamwork',
+    'holistic': 'complete',
+    'seamless': 'smooth',
+    'seamlessly': 'smooth',
+    'leverage': 'use',
+    'utilize': 'use',
+    'facilitate': 'help with',
+    'commence': 'start',
+    'robust': 'strong',
+    'foster': 'build',
+    'streamline': 'simplify',
+    'empower': 'enable',
+    'showcase': 'show',
+    'harness': 'use',
+    'garner': 'get',
+    'bolster': 'strengthen',
+    'enhance': 'improve',
+    'optimize': 'improve',
+    'intricate': 'complex',
+    'meticulous': 'careful',
+    'meticulously': 'careful',
+    'underscore': 'shows',
+    'underscores': 'shows',
+}
+
+
+def _trie_regex(words) -> str:
+    """Build a regex matching any of the words, factored on shared prefixes.
+
+    A flat "a|b|c" alternation makes re try every phrase at every position;
+    the trie form rejects most positions after a character or two. Longer
+    continuations are tried first, so "paradigm shift" still wins over
+    "paradigm" at the same position.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node) -> str:
+        is_word = '' in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if is_word:
+            body = '(?:' + body + ')?'
+        return body
+
+    return build(trie)
+
+
+# One pattern for the whole table: the trie-shaped word list, plus the
+# "it's worth noting that" opener, which is deleted along with the
+# whitespace after it
+_SANITIZE_RE = re.compile(
+    r"\b(?:(?P<noting>it(?:'s| is) worth noting that\s*)|" + _trie_regex(_SANITIZE_MAP) + r'\b)',
+    re.IGNORECASE)
+
+# " — ", " —", "— ", "—" and " – " all become a comma
+_DASH_RE = re.compile(' ?\u2014 ?| \u2013 ')
+_EN_DASH_TABLE = str.maketrans({'\u2013': '-'})
+
+_DOUBLE_COMMA_RE = re.compile(r',\s*,')
+_STRAY_COMMA_RE = re.compile(r'\s,\s(?=[a-z])')
+
+
+def _dash_replace(match) -> str:
+    # "word —word" keeps the original tight spacing; every other form gets ", "
+    return ',' if match.group(0) == ' \u2014' else ', '
+
+
+def _sanitize_replace(match) -> str:
+    if match.group('noting'):
+        return ''
+    found = match.group(0)
+    replacement = _SANITIZE_MAP[found.lower()]
+    if replacement and found[0].isupper():
+        return replacement[0].upper() + replacement[1:]
+    return replacement
+
 
 def sanitize_llm_output(text: str) -> str:
     """Post-process generated text to remove common LLM writing artifacts"""
-    import re
-
-    # Replace em dashes (with or without spaces) with comma-based or simpler phrasing
-    # " — " or "—" → ", " or " - "
-    text = text.replace(' — ', ', ')
-    text = text.replace(' —', ',')
-    text = text.replace('— ', ', ')
-    text = text.replace('—', ', ')
-    # En dashes too (AI uses these as em-dash substitutes in prose)
-    text = text.replace(' – ', ', ')
-    text = text.replace('–', '-')
-
-    # Remove overused LLM filler words/phrases (case-insensitive replacements)
-    llm_phrases = [
-        (r'\bdelve(?:s|d)?\b', 'explore'),
-        (r'\bdelving\b', 'exploring'),
-        (r'\bIt\'s worth noting that\s*', ''),
-        (r'\bIt is worth noting that\s*', ''),
-        (r'\bIn today\'s rapidly (?:evolving|changing) (?:landscape|world)\b', 'Today'),
-        (r'\bIn today\'s (?:landscape|world|environment|climate)\b', 'Today'),
-        (r'\brapidly evolving landscape\b', 'changing market'),
-        (r'\bever-evolving landscape\b', 'shifting market'),
-        (r'\bever-changing landscape\b', 'shifting market'),
-        (r'\bthe landscape of\b', 'the world of'),
-        (r'\bnavigate the (?:complex |)landscape\b', 'work through the challenges'),
-        (r'\bpivotal\b', 'important'),
-        (r'\bcrucial\b', 'important'),
-        (r'\bmoreover\b', 'also'),
-        (r'\bfurthermore\b', 'also'),
-        (r'\badditionally\b', 'also'),
-        (r'\bindeed\b', 'really'),
-        (r'\bMultifaceted\b', 'Complex'),
-        (r'\bmultifaceted\b', 'complex'),
-        (r'\btapestry\b', 'mix'),
-        (r'\bunlock(?:ing)? the (?:full )?potential\b', 'get the most out'),
-        (r'\bparadigm shift\b', 'big change'),
-        (r'\bparadigm\b', 'model'),
-        (r'\bsynergy\b', 'teamwork'),
-        (r'\bholistic\b', 'complete'),
-        (r'\bseamless(?:ly)?\b', 'smooth'),
-        (r'\bleverage\b', 'use'),
-        (r'\bLeverage\b', 'Use'),
-        (r'\butilize\b', 'use'),
-        (r'\bUtilize\b', 'Use'),
-        (r'\bfacilitate\b', 'help with'),
-        (r'\bcommence\b', 'start'),
-        (r'\brobust\b', 'strong'),
-        (r'\bRobust\b', 'Strong'),
-        (r'\bfoster\b', 'build'),
-        (r'\bstreamline\b', 'simplify'),
-        (r'\bempower\b', 'enable'),
-        (r'\bshowcase\b', 'show'),
-        (r'\bharness\b', 'use'),
-        (r'\bgarner\b', 'get'),
-        (r'\bbolster\b', 'strengthen'),
-        (r'\benhance\b', 'improve'),
-        (r'\boptimize\b', 'improve'),
-        (r'\bintricate\b', 'complex'),
-        (r'\bmeticulous(?:ly)?\b', 'careful'),
-        (r'\bunderscores?\b', 'shows'),
-    ]
-
-    for pattern, replacement in llm_phrases:
-        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE if pattern[0] != '\\' or 'A-Z' not in pattern else 0)
+    # Replace em dashes (with or without spaces) with comma-based or simpler phrasing,
+    # and spaced en dashes too (AI uses these as em-dash substitutes in prose).
+    # One regex pass covers every variant; bare en dashes become hyphens.
+    text = _DASH_RE.sub(_dash_replace, text)
+    text = text.translate(_EN_DASH_TABLE)
+
+    # Remove overused LLM filler words/phrases in a single pass
+    text = _SANITIZE_RE.sub(_sanitize_replace, text)
 
     # Clean up any double commas or comma-space issues from em dash replacement
-    text = re.sub(r',\s*,', ',', text)
-    text = re.sub(r',\s+,', ',', text)
+    text = _DOUBLE_COMMA_RE.sub(',', text)
     # Fix cases where em dash replacement created ", , " or leading commas
-    text = re.sub(r'\s,\s(?=[a-z])', ' ', text)
+    text = _STRAY_COMMA_RE.sub(' ', text)
 
     return text
 
@@ -337,7 +937,7 @@ def audit_article_voice(client, article_text: str, publication: str) -> str:
     if not article_text or not rules:
         return article_text
 
-    audit_prompt = f"""You are Dustin Lemick's editor. Below is a draft article ghostwritten in his voice, followed by his hard writing rules. Your only job is to fix every rule violation while preserving his ideas, argument, structure, anecdotes, facts, numbers, and names EXACTLY. Do not add new content, do not invent facts or numbers, do not change the meaning, do not change the word count meaningfully.
+    audit_prompt = f"""You are Dustin Lemick's editor. Below are his hard writing rules, followed by a draft article ghostwritten in his voice. Your only job is to fix every rule violation while preserving his ideas, argument, structure, anecdotes, facts, numbers, and names EXACTLY. Do not add new content, do not invent facts or numbers, do not change the meaning, do not change the word count meaningfully.
 
 Fix these tells specifically:
 - Remove ALL em dashes from the body (use commas, periods, colons, semicolons, or parentheses).
@@ -353,15 +953,19 @@ Return ONLY the corrected article text. No preamble, no notes, no explanation.
 {rules}
 
 === DRAFT TO FIX ===
-{article_text}"""
+"""
 
     try:
+        # Instructions + rules are identical on every call; only the draft varies
         response = client.messages.create(
-            model="claude-opus-4-8",
+            model=MODEL_TIERS['best'],
             max_tokens=4000,
             system="You are a meticulous editor who removes AI writing tells without changing the author's meaning, structure, or facts, and without inventing content.",
-            messages=[{"role": "user", "content": audit_prompt}]
+            messages=[{"role": "user", "content": cacheable_text(audit_prompt) + [
+                {"type": "text", "text": article_text}
+            ]}]
         )
+        log_llm_usage('audit', response)
         cleaned = (response.content[0].text or "").strip()
         return cleaned or article_text
     except Exception as e:
@@ -369,51 +973,52 @@ Return ONLY the corrected article text. No preamble, no notes, no explanation.
         return article_text
 
 
+# Markdown ## / ### subheadings
+_SUBHEADING_RE = re.compile(r'^(#{2,3}[ \t]+)(.+?)[ \t]*$', re.MULTILINE)
+# A "Key Takeaways" heading (## or **bold**) plus everything up to the next
+# markdown heading or end of text
+_KEY_TAKEAWAYS_RE = re.compile(
+    r'(?ims)^[ \t]*(?:#{1,4}[ \t]*|\*\*[ \t]*)key[ \t]+takeaways\b.*?(?=^[ \t]*#{1,4}[ \t]|\Z)')
+# An Oxford comma before a final and/or, only inside a real list (two
+# comma-separated items precede the conjunction)
+_SERIAL_COMMA_RE = re.compile(r'([^,\n.!?]+,[ \t]+[^,\n.!?]+),[ \t]+(and|or)\b', re.IGNORECASE)
+
+
 def enforce_publication_rules(text: str, publication: str) -> str:
     """Deterministically enforce publication-specific formatting the model is told
     to follow but may not always obey. Runs last, so the rule is guaranteed:
       - Fast Company: subheadings in ALL CAPS
       - Entrepreneur: no serial (Oxford) comma; no 'Key Takeaways' section
     """
-    import re
     if not text:
         return text
-    pub = (publication or '').lower().replace(' ', '')
+    pub = pub_key_for(publication)
 
     if pub == 'fastcompany':
-        # Uppercase markdown subheadings (## / ###)
-        text = re.sub(
-            r'^(#{2,3}[ \t]+)(.+?)[ \t]*$',
-            lambda m: m.group(1) + m.group(2).upper(),
-            text, flags=re.MULTILINE)
+        # Uppercase markdown subheadings
+        text = _SUBHEADING_RE.sub(lambda m: m.group(1) + m.group(2).upper(), text)
 
     if pub == 'entrepreneur':
-        # Remove a "Key Takeaways" block: the heading (## or **bold**) plus everything
-        # up to the next markdown heading or end of text.
-        text = re.sub(
-            r'(?ims)^[ \t]*(?:#{1,4}[ \t]*|\*\*[ \t]*)key[ \t]+takeaways\b.*?(?=^[ \t]*#{1,4}[ \t]|\Z)',
-            '', text)
-        # Drop the Oxford comma before a final and/or, but ONLY inside a real list
-        # (two comma-separated items precede the conjunction). This leaves ordinary
-        # compound-sentence commas ("He left, and she stayed") untouched.
-        text = re.sub(
-            r'([^,\n.!?]+,[ \t]+[^,\n.!?]+),[ \t]+(and|or)\b',
-            r'\1 \2', text, flags=re.IGNORECASE)
+        text = _KEY_TAKEAWAYS_RE.sub('', text)
+        # Drop the serial comma; ordinary compound-sentence commas
+        # ("He left, and she stayed") are left untouched
+        text = _SERIAL_COMMA_RE.sub(r'\1 \2', text)
 
     return text.strip()
 
 
-def get_google_docs_service():
-    """Get Google Docs API service"""
+@lru_cache(maxsize=None)
+def get_google_credentials():
+    """Service-account credentials for Docs/Drive. Shared so the OAuth access
+    token it mints is reused until it expires instead of fetched per export."""
     from google.oauth2 import service_account
-    from googleapiclient.discovery import build
 
     creds_json = os.environ.get('GOOGLE_DOCS_CREDENTIALS')
     if not creds_json:
         raise ValueError("GOOGLE_DOCS_CREDENTIALS not set")
 
-    creds_data = json.loads(creds_json)
-    credentials = service_account.Credentials.from_service_account_info(
+    creds_data = orjson.loads(creds_json)
+    return service_account.Credentials.from_service_account_info(
         creds_data,
         scopes=[
             'https://www.googleapis.com/auth/documents',
@@ -421,11 +1026,34 @@ def get_google_docs_service():
         ]
     )
 
+def get_google_docs_service():
+    """Get Google Docs API service"""
+    from googleapiclient.discovery import build
+
+    credentials = get_google_credentials()
+
     docs_service = build('docs', 'v1', credentials=credentials)
     drive_service = build('drive', 'v3', credentials=credentials)
 
     return docs_service, drive_service
 
+# Built Docs/Drive clients are reused across exports instead of rebuilding
+# them (and their HTTP connections) per request. httplib2 connections are
+# not thread-safe, so each pair is checked out by one export at a time.
+_google_services_pool = queue.LifoQueue()
+
+@contextmanager
+def google_docs_services():
+    """Check out a (docs_service, drive_service) pair, building one if none is idle"""
+    try:
+        services = _google_services_pool.get_nowait()
+    except queue.Empty:
+        services = get_google_docs_service()
+    try:
+        yield services
+    finally:
+        _google_services_pool.put(services)
+
 # ===================
 # Routes - Authentication
 # ===================
@@ -436,31 +1064,19 @@ def auth_login():
     if get_current_user():
         return redirect('/')
     redirect_uri = url_for('auth_callback', _external=True)
-    return google.authorize_redirect(redirect_uri)
+    return get_google_oauth().authorize_redirect(redirect_uri)
 
 @app.route('/auth/callback')
 def auth_callback():
     """Handle Google OAuth callback"""
     try:
-        token = google.authorize_access_token()
+        token = get_google_oauth().authorize_access_token()
         user_info = token.get('userinfo')
         if not user_info:
             return 'Failed to get user info', 400
         email = user_info.get('email', '')
         if not email.endswith(f'@{ALLOWED_DOMAIN}'):
-            return f'''
-            <html>
-            <head><title>Access Denied</title></head>
-            <body style="font-family: system-ui; display: flex; justify-content: center; align-items: center; height: 100vh; margin: 0; background: linear-gradient(135deg, #018181 0%, #272d3f 100%); color: white;">
-                <div style="text-align: center; padding: 40px; background: rgba(0,0,0,0.3); border-radius: 12px;">
-                    <h1>Access Denied</h1>
-                    <p>Only @{ALLOWED_DOMAIN} email addresses are allowed.</p>
-                    <p style="color: #a0aec0;">You signed in with: {email}</p>
-                    <a href="/auth/logout" style="color: #00E5E5;">Try a different account</a>
-                </div>
-            </body>
-            </html>
-            ''', 403
+            return _ACCESS_DENIED_PAGE.format(email=escape_html(email)), 403
         session['user'] = {
             'email': email,
             'name': user_info.get('name', ''),
@@ -489,6 +1105,10 @@ def get_user():
 # Routes - Static Files
 # ===================
 
+# index.html never changes at runtime, so read it once and split around
+# </head>; each request only has to build the small AUTH_USER script.
+_INDEX_HEAD, _INDEX_BODY = (Path(__file__).parent / 'index.html').read_bytes().split(b'</head>', 1)
+
 @app.route('/')
 def index():
     """Serve the main application - redirect to login if not authenticated"""
@@ -496,42 +1116,66 @@ def index():
     if not user:
         return redirect('/auth/login')
 
-    with open('index.html', 'r', encoding='utf-8') as f:
-        html = f.read()
+    # Inject user info for the frontend ("</" is escaped so a crafted name
+    # can't close the script tag early)
+    user_json = orjson.dumps(user).replace(b'</', b'<\\/')
+    html = _INDEX_HEAD + b'<script>\n    window.AUTH_USER = ' + user_json + b';\n    </script>\n</head>' + _INDEX_BODY
 
-    # Inject user info for the frontend
-    user_script = f'''<script>
-    window.AUTH_USER = {json.dumps(user)};
-    </script>
-</head>'''
-    html = html.replace('</head>', user_script, 1)
+    response = Response(html, mimetype='text/html')
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
 
-    return Response(html, mimetype='text/html')
+# Build-fingerprinted names (app.3f9a1c2e.js) never change content, so the
+# browser may keep them for a year; anything else is revalidated hourly.
+_FINGERPRINTED_RE = re.compile(r'\.[0-9a-f]{8,}\.\w+$')
 
 @app.route('/static/<path:filename>')
 def serve_static(filename):
     """Serve static files"""
-    return send_from_directory('static', filename)
+    if _FINGERPRINTED_RE.search(filename):
+        response = send_from_directory('static', filename, max_age=31536000)
+        response.cache_control.immutable = True
+        return response
+    return send_from_directory('static', filename, max_age=3600)
 
 # ===================
 # Routes - Configuration
 # ===================
 
+# The config payload only changes when the year rolls over, so the encoded
+# body is kept and rebuilt on the first request of a new year.
+_app_config_json = (None, None)
+
 @app.route('/api/config', methods=['GET'])
 def get_config():
     """Get application configuration"""
-    return jsonify({
-        'publications': [
-            {'id': 'forbes', 'name': 'Forbes', 'full_name': 'Forbes Business Council'},
-            {'id': 'entrepreneur', 'name': 'Entrepreneur', 'full_name': 'Entrepreneur Leadership Network'},
-            {'id': 'fastcompany', 'name': 'Fast Company', 'full_name': 'Fast Company Executive Board'}
-        ],
-        'months': [
-            'January', 'February', 'March', 'April', 'May', 'June',
-            'July', 'August', 'September', 'October', 'November', 'December'
-        ],
-        'current_year': datetime.now().year
-    })
+    global _app_config_json
+    year, body = _app_config_json
+    current_year = datetime.now().year
+    if year != current_year:
+        body = orjson.dumps({
+            'publications': [
+                {'id': 'forbes', 'name': 'Forbes', 'full_name': 'Forbes Business Council'},
+                {'id': 'entrepreneur', 'name': 'Entrepreneur', 'full_name': 'Entrepreneur Leadership Network'},
+                {'id': 'fastcompany', 'name': 'Fast Company', 'full_name': 'Fast Company Executive Board'}
+            ],
+            'months': [
+                'January', 'February', 'March', 'April', 'May', 'June',
+                'July', 'August', 'September', 'October', 'November', 'December'
+            ],
+            'current_year': current_year
+        })
+        _app_config_json = (current_year, body)
+
+    response = Response(body, mimetype='application/json')
+    response.headers['Cache-Control'] = 'private, max-age=3600'
+    return response
+
+@app.route('/api/admin/reload-config', methods=['POST'])
+def reload_config():
+    """Clear cached style guides, brand guide, examples, and topic archive"""
+    clear_config_caches()
+    return jsonify({'success': True, 'message': 'Config caches cleared'})
 
 @app.route('/api/style-guide/<publication>', methods=['GET'])
 def get_style_guide(publication):
@@ -551,13 +1195,7 @@ def get_topic_archive():
 def get_publication_archive(publication):
     """Get topic archive for a specific publication"""
     archive = load_topic_archive()
-    # Map frontend IDs to archive keys
-    pub_key_map = {
-        'forbes': 'forbes',
-        'entrepreneur': 'entrepreneur',
-        'fastcompany': 'fast_company'
-    }
-    pub_key = pub_key_map.get(publication.lower(), publication.lower())
+    pub_key = ARCHIVE_KEYS.get(publication.lower(), publication.lower())
     if pub_key in archive:
         return jsonify(archive[pub_key])
     return jsonify({'error': 'Publication not found', 'tried_key': pub_key}), 404
@@ -591,7 +1229,9 @@ def research_topics():
         Provide 5-7 trending topics with brief descriptions of why they're relevant right now.
         """
 
-        response = client.chat.completions.create(
+        research_results = cached_llm_call(
+            'research_topics',
+            client.chat.completions.create,
             model="sonar",
             messages=[
                 {"role": "system", "content": "You are a business trend researcher. Provide current, timely topics for thought leadership articles."},
@@ -600,8 +1240,6 @@ def research_topics():
             max_tokens=1500
         )
 
-        research_results = response.choices[0].message.content
-
         return jsonify({
             'success': True,
             'research': research_results,
@@ -624,34 +1262,26 @@ def generate_topics():
 
     try:
         # Load style guide and archive
-        style_guide = load_style_guide(publication)
+        facts = publication_prompt_facts(publication)
         archive = load_topic_archive()
 
         # Get past topics to avoid
-        pub_key_map = {
-            'forbes': 'forbes',
-            'entrepreneur': 'entrepreneur',
-            'fastcompany': 'fast_company'
-        }
-        pub_key = pub_key_map.get(publication.lower(), publication.lower())
+        pub_key = ARCHIVE_KEYS.get(publication.lower(), publication.lower())
         past_topics = []
         if pub_key in archive:
             past_topics = archive[pub_key].get('topics_to_avoid', [])
 
-        # Use Claude for topic generation
-        client = get_anthropic_client()
-
         prompt = f"""
         Generate 10 unique topic ideas for a {publication} thought leadership article for {month} {year}.
 
         PUBLICATION STYLE:
-        - Publication: {style_guide.get('publication_full_name', publication)}
-        - Typical word count: {style_guide.get('specifications', {}).get('word_count', {}).get('min', 700)}-{style_guide.get('specifications', {}).get('word_count', {}).get('max', 800)} words
-        - Tone: {', '.join(style_guide.get('tone', {}).get('primary', ['professional']))}
+        - Publication: {facts['full_name']}
+        - Typical word count: {facts['word_min']}-{facts['word_max']} words
+        - Tone: {facts['tone']}
         - Author: Dustin Lemick, CEO of BriteCo (jewelry/watch insurance, insurtech)
 
         HEADLINE PATTERNS TO USE:
-        {json.dumps(style_guide.get('headline_patterns', []), indent=2)}
+        {facts['headline_patterns']}
 
         CURRENT RESEARCH/TRENDS:
         {research}
@@ -665,32 +1295,13 @@ def generate_topics():
         3. Why it's timely for {month} {year}
         4. How Dustin/BriteCo could connect to this topic
 
-        Return as JSON array with 10 objects, each having: headline, angle, timeliness, briteco_connection
+        Return the 10 topics with the emit_topics tool.
         """
 
-        response = client.messages.create(
-            model="claude-opus-4-8",
-            max_tokens=3000,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-
-        # Parse response
-        response_text = response.content[0].text
-
-        # Try to extract JSON from response
-        try:
-            # Find JSON array in response
-            start_idx = response_text.find('[')
-            end_idx = response_text.rfind(']') + 1
-            if start_idx != -1 and end_idx > start_idx:
-                json_str = response_text[start_idx:end_idx]
-                topics = json.loads(json_str)
-            else:
-                topics = []
-        except json.JSONDecodeError:
-            topics = [{"headline": "Error parsing topics", "angle": response_text, "timeliness": "", "briteco_connection": ""}]
+        # "Regenerate" resends this exact prompt (research included), which is
+        # well past the minimum cacheable length, so mark it for prompt caching
+        topics = claude_tool_call('generate_topics', cacheable_text(prompt),
+                                  EMIT_TOPICS_TOOL, max_tokens=3000).get('topics', [])
 
         return jsonify({
             'success': True,
@@ -713,10 +1324,18 @@ def refine_topic():
 
     try:
         # Load style guide
-        style_guide = load_style_guide(publication)
-
-        # Use Claude to refine the topic
-        client = get_anthropic_client()
+        facts = publication_prompt_facts(publication)
+
+        # A headline that already fits one of the publication's patterns,
+        # lengths and capitalization, with an angle to go with it, has nothing
+        # for Claude to polish
+        check = facts['headline_check']
+        if check and angle and headline_fits(check, headline):
+            print(f"[LLM] refine_topic: headline already fits {publication} patterns, skipped")
+            return jsonify({
+                'success': True,
+                'topic': {"headline": headline, "angle": angle, "timeliness": "Custom topic", "briteco_connection": ""}
+            })
 
         prompt = f"""
         Refine this custom topic idea into a polished {publication} article topic.
@@ -726,9 +1345,9 @@ def refine_topic():
         Description/Angle: {angle}
 
         PUBLICATION STYLE:
-        - Publication: {style_guide.get('publication_full_name', publication)}
-        - Headline patterns: {json.dumps(style_guide.get('headline_patterns', []), indent=2)}
-        - Tone: {', '.join(style_guide.get('tone', {}).get('primary', ['professional']))}
+        - Publication: {facts['full_name']}
+        - Headline patterns: {facts['headline_patterns']}
+        - Tone: {facts['tone']}
         - Author: Dustin Lemick, CEO of BriteCo (jewelry/watch insurance, insurtech)
 
         Please refine this into:
@@ -737,31 +1356,10 @@ def refine_topic():
         3. Why this is timely and relevant
         4. How Dustin/BriteCo could naturally connect to this topic
 
-        Return as JSON object with: headline, angle, timeliness, briteco_connection
+        Return the refined topic with the emit_topic tool.
         """
 
-        response = client.messages.create(
-            model="claude-opus-4-8",
-            max_tokens=1000,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-
-        # Parse response
-        response_text = response.content[0].text
-
-        # Try to extract JSON from response
-        try:
-            start_idx = response_text.find('{')
-            end_idx = response_text.rfind('}') + 1
-            if start_idx != -1 and end_idx > start_idx:
-                json_str = response_text[start_idx:end_idx]
-                topic = json.loads(json_str)
-            else:
-                topic = {"headline": headline, "angle": angle, "timeliness": "Custom topic", "briteco_connection": ""}
-        except json.JSONDecodeError:
-            topic = {"headline": headline, "angle": angle, "timeliness": "Custom topic", "briteco_connection": ""}
+        topic = claude_tool_call('refine_topic', prompt, EMIT_TOPIC_TOOL, max_tokens=500, tier='fast') or {"headline": headline, "angle": angle, "timeliness": "Custom topic", "briteco_connection": ""}
 
         return jsonify({
             'success': True,
@@ -779,8 +1377,7 @@ def generate_variations():
     topic = data.get('topic', {})
 
     try:
-        style_guide = load_style_guide(publication)
-        client = get_anthropic_client()
+        facts = publication_prompt_facts(publication)
 
         prompt = f"""
         A CEO liked this topic idea for a {publication} article but wants to explore variations on the same theme.
@@ -792,9 +1389,9 @@ def generate_variations():
         BriteCo Connection: {topic.get('briteco_connection', '')}
 
         PUBLICATION STYLE:
-        - Publication: {style_guide.get('publication_full_name', publication)}
-        - Headline patterns: {json.dumps(style_guide.get('headline_patterns', []), indent=2)}
-        - Tone: {', '.join(style_guide.get('tone', {}).get('primary', ['professional']))}
+        - Publication: {facts['full_name']}
+        - Headline patterns: {facts['headline_patterns']}
+        - Tone: {facts['tone']}
         - Author: Dustin Lemick, CEO of BriteCo (jewelry/watch insurance, insurtech)
 
         Generate 10 NEW topic variations that explore the SAME general theme but with different angles, perspectives, or hooks.
@@ -806,26 +1403,11 @@ def generate_variations():
         3. Why it's timely and relevant
         4. How Dustin/BriteCo could connect to this topic
 
-        Return as JSON array with 10 objects, each having: headline, angle, timeliness, briteco_connection
+        Return the 10 variations with the emit_topics tool.
         """
 
-        response = client.messages.create(
-            model="claude-opus-4-8",
-            max_tokens=3000,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        response_text = response.content[0].text
-
-        try:
-            start_idx = response_text.find('[')
-            end_idx = response_text.rfind(']') + 1
-            if start_idx != -1 and end_idx > start_idx:
-                topics = json.loads(response_text[start_idx:end_idx])
-            else:
-                topics = []
-        except json.JSONDecodeError:
-            topics = []
+        topics = claude_tool_call('generate_variations', prompt, EMIT_TOPICS_TOOL,
+                                  max_tokens=3000, tier='balanced').get('topics', [])
 
         return jsonify({
             'success': True,
@@ -844,8 +1426,7 @@ def generate_talking_points():
     topic = data.get('topic', {})
 
     try:
-        style_guide = load_style_guide(publication)
-        client = get_anthropic_client()
+        facts = publication_prompt_facts(publication)
 
         prompt = f"""
         Generate 5-7 talking points and thought-provoking questions for a CEO who is about to record their thoughts on this topic for a {publication} article.
@@ -855,7 +1436,7 @@ def generate_talking_points():
         Angle: {topic.get('angle', '')}
         BriteCo Connection: {topic.get('briteco_connection', '')}
 
-        PUBLICATION: {style_guide.get('publication_full_name', publication)}
+        PUBLICATION: {facts['full_name']}
         AUTHOR: Dustin Lemick, CEO of BriteCo (jewelry/watch insurance, insurtech)
 
         Generate a mix of:
@@ -863,30 +1444,13 @@ def generate_talking_points():
         - Thought-provoking questions to spark ideas (starting with "What...", "How...", "When...")
         - A prompt about a personal story or BriteCo example they could share
 
-        Return as a JSON array of objects, each with:
-        - "type": either "talking_point" or "question"
-        - "text": the talking point or question text
+        Return the items with the emit_talking_points tool.
 
         Keep each item concise (1-2 sentences max). Focus on substance, not platitudes.
         """
 
-        response = client.messages.create(
-            model="claude-opus-4-8",
-            max_tokens=1500,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        response_text = response.content[0].text
-
-        try:
-            start_idx = response_text.find('[')
-            end_idx = response_text.rfind(']') + 1
-            if start_idx != -1 and end_idx > start_idx:
-                points = json.loads(response_text[start_idx:end_idx])
-            else:
-                points = []
-        except json.JSONDecodeError:
-            points = [{"type": "talking_point", "text": response_text}]
+        points = claude_tool_call('generate_talking_points', prompt, EMIT_TALKING_POINTS_TOOL,
+                                  max_tokens=800, tier='fast', cached=True).get('talking_points', [])
 
         return jsonify({
             'success': True,
@@ -905,12 +1469,12 @@ def generate_inspiration():
     topic = data.get('topic', {})
 
     try:
-        style_guide = load_style_guide(publication)
+        facts = publication_prompt_facts(publication)
         brand_guide = load_brand_guide()
         client = get_anthropic_client()
 
         prompt = f"""
-        You are helping a CEO prepare to record his thoughts for a {style_guide.get('publication_full_name', publication)} thought leadership article.
+        You are helping a CEO prepare to record his thoughts for a {facts['full_name']} thought leadership article.
 
         TOPIC:
         Headline: {topic.get('headline', '')}
@@ -919,8 +1483,8 @@ def generate_inspiration():
         BriteCo Connection: {topic.get('briteco_connection', '')}
 
         AUTHOR: Dustin Lemick, CEO of BriteCo, an insurtech company providing specialty jewelry and watch insurance.
-        PUBLICATION TONE: {', '.join(style_guide.get('tone', {}).get('primary', ['professional']))}
-        TARGET WORD COUNT: {style_guide.get('specifications', {}).get('word_count', {}).get('min', 700)}-{style_guide.get('specifications', {}).get('word_count', {}).get('max', 800)} words
+        PUBLICATION TONE: {facts['tone']}
+        TARGET WORD COUNT: {facts['word_min']}-{facts['word_max']} words
 
         Generate a detailed article brief to inspire and guide the CEO before recording. Format as HTML with the following sections:
 
@@ -940,15 +1504,17 @@ def generate_inspiration():
         Return ONLY the HTML content (no markdown, no code blocks). Use <h4> for section headers, <ul><li> for lists, <p> for paragraphs, and <strong> for emphasis.
         """
 
-        response = client.messages.create(
-            model="claude-opus-4-8",
+        inspiration = cached_llm_call(
+            'generate_inspiration',
+            client.messages.create,
+            model=MODEL_TIERS['best'],
             max_tokens=2000,
             messages=[{"role": "user", "content": prompt}]
         )
 
         return jsonify({
             'success': True,
-            'inspiration': response.content[0].text
+            'inspiration': inspiration
         })
 
     except Exception as e:
@@ -970,29 +1536,20 @@ def transcribe_audio():
 
         # Preserve original file extension so Whisper can detect format
         original_ext = os.path.splitext(audio_file.filename or '')[1] or '.webm'
-        with tempfile.NamedTemporaryFile(delete=False, suffix=original_ext) as tmp:
-            audio_file.save(tmp.name)
-            tmp_path = tmp.name
 
-        try:
-            # Transcribe with Whisper
-            client = get_openai_client()
-
-            with open(tmp_path, 'rb') as f:
-                transcript = client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=f,
-                    response_format="text"
-                )
-
-            return jsonify({
-                'success': True,
-                'transcription': transcript
-            })
+        # Transcribe with Whisper, streaming the upload Werkzeug already
+        # spooled instead of copying it to another temp file first
+        client = get_openai_client()
+        transcript = client.audio.transcriptions.create(
+            model="whisper-1",
+            file=(f"audio{original_ext}", audio_file.stream, audio_file.mimetype or 'audio/webm'),
+            response_format="text"
+        )
 
-        finally:
-            # Clean up temp file
-            os.unlink(tmp_path)
+        return jsonify({
+            'success': True,
+            'transcription': transcript
+        })
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -1001,29 +1558,15 @@ def transcribe_audio():
 # Routes - Article Generation
 # ===================
 
-@app.route('/api/generate-article', methods=['POST'])
-def generate_article():
-    """Generate article from transcription using style guide"""
-    data = request.json
-    publication = data.get('publication')
-    month = data.get('month')
-    year = data.get('year', datetime.now().year)
-    topic = data.get('topic', {})
-    transcription = data.get('transcription', '')
+_WORD_RE = re.compile(r'\S+')
 
-    try:
-        # Load style guide and brand guide
-        style_guide = load_style_guide(publication)
-        brand_guide = load_brand_guide()
+def count_words(text: str) -> int:
+    """Whitespace-separated word count, without building a list of the words"""
+    return sum(1 for _ in _WORD_RE.finditer(text))
 
-        # Use Claude for article generation
-        client = get_anthropic_client()
-
-        # Build system prompt (voice, rules, examples)
-        system_prompt = build_article_system_prompt(publication, style_guide, brand_guide)
-
-        # Build user prompt (specific task)
-        prompt = f"""Write a thought leadership article for {style_guide.get('publication_full_name', publication)}.
+def build_article_prompt(publication: str, facts: dict, topic: dict, transcription: str) -> str:
+    """Build the per-request user prompt for article generation"""
+    return f"""Write a thought leadership article for {facts['full_name']}.
 
         TOPIC:
         Headline: {topic.get('headline', 'Untitled')}
@@ -1033,45 +1576,82 @@ def generate_article():
         {transcription}
 
         REQUIREMENTS:
-        - Word count: {style_guide.get('specifications', {}).get('word_count', {}).get('min', 700)}-{style_guide.get('specifications', {}).get('word_count', {}).get('max', 800)} words (strict, do not exceed {style_guide.get('specifications', {}).get('word_count', {}).get('max', 800)} words)
-        - Subheading format: {"ALL CAPS" if publication.lower() == 'fastcompany' else "Sentence case phrases"}
-        {"- Do NOT include Key Takeaways bullets — Entrepreneur editors add those on their end." if publication.lower() == 'entrepreneur' else ""}
-        {"- PUNCTUATION OVERRIDE: Do NOT use the serial comma for this publication (e.g., 'apples, oranges and bananas' NOT 'apples, oranges, and bananas'). Do NOT link to Forbes, Fast Company, or Inc. (competitors)." if publication.lower() == 'entrepreneur' else ""}
+        - Word count: {facts['word_min']}-{facts['word_max']} words (strict, do not exceed {facts['word_max']} words)
+        - Subheading format: {"ALL CAPS" if facts['all_caps_subheadings'] else "Sentence case phrases"}
+        {facts['article_rules']}
 
         STRUCTURE:
-        {json.dumps(style_guide.get('article_formats', [{}])[0].get('structure', {}), indent=2)}
+        {facts['structure']}
 
         BRITECO INTEGRATION:
         - Weave in 2-4 references to BriteCo, Dustin's experience, or the jewelry/insurance industry
         - Use natural connections, not forced mentions
 
         SAMPLE SUBHEADINGS FROM THIS PUBLICATION:
-        {json.dumps(style_guide.get('subheading_patterns', {}).get('examples', [])[:5], indent=2)}
+        {facts['subheading_examples']}
 
         Use specific, concrete details from the transcription rather than generic business platitudes.
         Write the complete article now. Make it engaging, insightful, and true to the CEO's voice from the transcription.
         """
 
+def finish_article(client, article_content: str, publication: str) -> str:
+    """Post-process a generated draft into the final article text"""
+    # Second-pass voice audit: rewrite out AI tells per Dustin's hard rules
+    article_content = audit_article_voice(client, article_content, publication)
+    # Deterministic backstop for any remaining LLM artifacts
+    article_content = sanitize_llm_output(article_content)
+    # Guarantee publication-specific rules (ALL-CAPS subheads, no Oxford comma, etc.)
+    return enforce_publication_rules(article_content, publication)
+
+def sse_event(payload: dict) -> bytes:
+    """Format a dict as one Server-Sent Events message"""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
+
+def sse_response(events):
+    """Stream an SSE generator without proxy buffering"""
+    return Response(
+        stream_with_context(events),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@app.route('/api/generate-article', methods=['POST'])
+def generate_article():
+    """Generate article from transcription using style guide"""
+    data = request.json
+    publication = data.get('publication')
+    month = data.get('month')
+    year = data.get('year', datetime.now().year)
+    topic = data.get('topic', {})
+    transcription = data.get('transcription', '')
+
+    try:
+        # Load style guide
+        facts = publication_prompt_facts(publication)
+
+        # Use Claude for article generation
+        client = get_anthropic_client()
+
+        # Build system prompt (voice, rules, examples)
+        system_prompt = build_article_system_prompt(publication)
+
+        # Build user prompt (specific task)
+        prompt = build_article_prompt(publication, facts, topic, transcription)
+
         response = client.messages.create(
-            model="claude-opus-4-8",
+            model=MODEL_TIERS['best'],
             max_tokens=4000,
-            system=system_prompt,
+            system=cacheable_text(system_prompt),
             messages=[
                 {"role": "user", "content": prompt}
             ]
         )
+        log_llm_usage('generate_article', response)
 
-        article_content = response.content[0].text
-
-        # Second-pass voice audit: rewrite out AI tells per Dustin's hard rules
-        article_content = audit_article_voice(client, article_content, publication)
-        # Deterministic backstop for any remaining LLM artifacts
-        article_content = sanitize_llm_output(article_content)
-        # Guarantee publication-specific rules (ALL-CAPS subheads, no Oxford comma, etc.)
-        article_content = enforce_publication_rules(article_content, publication)
+        article_content = finish_article(client, response.content[0].text, publication)
 
         # Count words
-        word_count = len(article_content.split())
+        word_count = count_words(article_content)
 
         return jsonify({
             'success': True,
@@ -1086,23 +1666,60 @@ def generate_article():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/rewrite-article', methods=['POST'])
-def rewrite_article():
-    """Rewrite/improve an article section"""
+@app.route('/api/generate-article/stream', methods=['POST'])
+def generate_article_stream():
+    """Generate article like /api/generate-article, streaming the first draft as
+    SSE 'delta' events. A 'status' event marks the voice audit, and the final
+    event carries the same fields as the JSON endpoint."""
     data = request.json
     publication = data.get('publication')
-    article = data.get('article')
-    instructions = data.get('instructions', 'Improve this article')
+    month = data.get('month')
+    year = data.get('year', datetime.now().year)
+    topic = data.get('topic', {})
+    transcription = data.get('transcription', '')
 
-    try:
-        style_guide = load_style_guide(publication)
-        brand_guide = load_brand_guide()
-        client = get_anthropic_client()
+    def events():
+        try:
+            facts = publication_prompt_facts(publication)
+            client = get_anthropic_client()
+            system_prompt = build_article_system_prompt(publication)
+            prompt = build_article_prompt(publication, facts, topic, transcription)
+
+            with client.messages.stream(
+                model=MODEL_TIERS['best'],
+                max_tokens=4000,
+                system=cacheable_text(system_prompt),
+                messages=[
+                    {"role": "user", "content": prompt}
+                ]
+            ) as stream:
+                for text in stream.text_stream:
+                    yield sse_event({'delta': text})
+                response = stream.get_final_message()
+            log_llm_usage('generate_article', response)
+
+            yield sse_event({'status': 'auditing'})
+            article_content = finish_article(client, response.content[0].text, publication)
+
+            yield sse_event({
+                'done': True,
+                'success': True,
+                'article': article_content,
+                'word_count': count_words(article_content),
+                'publication': publication,
+                'topic': topic,
+                'month': month,
+                'year': year
+            })
 
-        # Build system prompt (voice, rules, examples)
-        system_prompt = build_article_system_prompt(publication, style_guide, brand_guide)
+        except Exception as e:
+            yield sse_event({'done': True, 'error': str(e)})
+
+    return sse_response(events())
 
-        prompt = f"""Rewrite/improve this {publication} article based on these instructions:
+def build_rewrite_prompt(publication: str, facts: dict, article: str, instructions: str) -> str:
+    """Build the per-request user prompt for an article rewrite"""
+    return f"""Rewrite/improve this {publication} article based on these instructions:
 
         INSTRUCTIONS: {instructions}
 
@@ -1111,43 +1728,156 @@ def rewrite_article():
 
         REQUIREMENTS:
         - Maintain the {publication} style and format
-        - Keep subheadings in {"ALL CAPS" if publication.lower() == 'fastcompany' else "sentence case"}
-        - Target word count: {style_guide.get('specifications', {}).get('word_count', {}).get('min', 700)}-{style_guide.get('specifications', {}).get('word_count', {}).get('max', 800)} words (strict, do not exceed {style_guide.get('specifications', {}).get('word_count', {}).get('max', 800)} words)
-        {"- PUNCTUATION OVERRIDE: Do NOT use the serial comma for this publication (e.g., 'apples, oranges and bananas' NOT 'apples, oranges, and bananas'). Do NOT link to Forbes, Fast Company, or Inc. (competitors)." if publication.lower() == 'entrepreneur' else ""}
+        - Keep subheadings in {"ALL CAPS" if facts['all_caps_subheadings'] else "sentence case"}
+        - Target word count: {facts['word_min']}-{facts['word_max']} words (strict, do not exceed {facts['word_max']} words)
+        {facts['rewrite_rules']}
 
         Provide the complete rewritten article.
         """
 
+@app.route('/api/rewrite-article', methods=['POST'])
+def rewrite_article():
+    """Rewrite/improve an article section"""
+    data = request.json
+    publication = data.get('publication')
+    article = data.get('article')
+    instructions = data.get('instructions', 'Improve this article')
+
+    try:
+        facts = publication_prompt_facts(publication)
+        client = get_anthropic_client()
+
+        # Build system prompt (voice, rules, examples)
+        system_prompt = build_article_system_prompt(publication)
+
+        prompt = build_rewrite_prompt(publication, facts, article, instructions)
+
         response = client.messages.create(
-            model="claude-opus-4-8",
+            model=MODEL_TIERS['best'],
             max_tokens=4000,
-            system=system_prompt,
+            system=cacheable_text(system_prompt),
             messages=[
                 {"role": "user", "content": prompt}
             ]
         )
+        log_llm_usage('rewrite_article', response)
 
-        rewritten = audit_article_voice(client, response.content[0].text, publication)
-        rewritten = sanitize_llm_output(rewritten)
-        rewritten = enforce_publication_rules(rewritten, publication)
+        rewritten = finish_article(client, response.content[0].text, publication)
 
         return jsonify({
             'success': True,
             'article': rewritten,
-            'word_count': len(rewritten.split())
+            'word_count': count_words(rewritten)
         })
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/rewrite-article/stream', methods=['POST'])
+def rewrite_article_stream():
+    """Rewrite like /api/rewrite-article, streaming the rewrite as SSE 'delta'
+    events before the voice audit; the final event matches the JSON endpoint."""
+    data = request.json
+    publication = data.get('publication')
+    article = data.get('article')
+    instructions = data.get('instructions', 'Improve this article')
+
+    def events():
+        try:
+            facts = publication_prompt_facts(publication)
+            client = get_anthropic_client()
+            system_prompt = build_article_system_prompt(publication)
+            prompt = build_rewrite_prompt(publication, facts, article, instructions)
+
+            with client.messages.stream(
+                model=MODEL_TIERS['best'],
+                max_tokens=4000,
+                system=cacheable_text(system_prompt),
+                messages=[
+                    {"role": "user", "content": prompt}
+                ]
+            ) as stream:
+                for text in stream.text_stream:
+                    yield sse_event({'delta': text})
+                response = stream.get_final_message()
+            log_llm_usage('rewrite_article', response)
+
+            yield sse_event({'status': 'auditing'})
+            rewritten = finish_article(client, response.content[0].text, publication)
+
+            yield sse_event({
+                'done': True,
+                'success': True,
+                'article': rewritten,
+                'word_count': count_words(rewritten)
+            })
+
+        except Exception as e:
+            yield sse_event({'done': True, 'error': str(e)})
+
+    return sse_response(events())
+
 # ===================
 # Routes - Draft Management (GCS)
 # ===================
 
+def mutate_json_blob(blob, mutate, default, dumps=orjson.dumps, retries=5):
+    """Read-modify-write a JSON blob without losing concurrent updates.
+
+    mutate(value) gets the current value (default() if the blob doesn't
+    exist) and returns the new value, or None to leave the blob alone. The
+    upload only succeeds if the blob still has the generation that was read;
+    otherwise it's re-read and mutate runs again, after a jittered backoff.
+    Returns (value, raw): raw is the uploaded bytes, or None if nothing was
+    written."""
+    for attempt in range(retries):
+        try:
+            value = orjson.loads(blob.download_as_bytes())
+            generation = blob.generation
+        except NotFound:
+            value, generation = default(), 0  # 0: only if it still doesn't exist
+
+        new_value = mutate(value)
+        if new_value is None:
+            return value, None
+
+        raw = dumps(new_value)
+        try:
+            blob.upload_from_string(raw, content_type='application/json', if_generation_match=generation)
+            return new_value, raw
+        except PreconditionFailed:
+            if attempt == retries - 1:
+                raise
+            print(f"[WARNING] {blob.name} changed during update, retrying")
+            time.sleep(random.uniform(0, 0.05 * 2 ** attempt))
+
+# Fields the draft/completed list views show. They are also stored on the
+# blob as metadata when a record is written, so listing can read them from the
+# object listing instead of downloading every body.
+_SUMMARY_FIELDS = ('id', 'publication', 'month', 'year', 'current_step', 'created_at',
+                   'created_by', 'updated_at', 'completed_at', 'completed_by')
+
+def record_summary(record: dict) -> dict:
+    """The list-view fields of a draft or completed record"""
+    summary = {field: record[field] for field in _SUMMARY_FIELDS if field in record}
+    summary['title'] = record.get('data', {}).get('topic', {}).get('headline', 'Untitled')
+    return summary
+
+def set_summary_metadata(blob, record: dict) -> None:
+    """Attach the record's summary and ClickUp task id ('' for none) to the
+    blob; sent with the next upload"""
+    try:
+        blob.metadata = {'summary': orjson.dumps(record_summary(record)).decode('utf-8'),
+                         'clickup_task_id': article_clickup_task_id(record) or ''}
+    except Exception:
+        # Malformed records are skipped by the list views either way
+        blob.metadata = None
+
 @app.route('/api/drafts/save', methods=['POST'])
 def save_draft():
     """Save a draft to GCS"""
-    if not gcs_client:
+    bucket = get_gcs_bucket()
+    if bucket is None:
         return jsonify({'success': False, 'error': 'GCS not available'}), 503
 
     try:
@@ -1158,70 +1888,121 @@ def save_draft():
         current_user = get_current_user()
         user_email = current_user.get('email', 'Unknown') if current_user else data.get('user_email', 'Unknown')
 
-        # Check if draft already exists to preserve created_at and created_by
-        existing_draft = {}
-        bucket = gcs_client.bucket(GCS_BUCKET_NAME)
-        blob_name = f"drafts/{draft_id}.json"
-        blob = bucket.blob(blob_name)
+        blob = bucket.blob(f"drafts/{draft_id}.json")
 
-        if blob.exists():
-            existing_draft = json.loads(blob.download_as_text())
+        def update(existing_draft):
+            # Preserve created_at and created_by from the existing draft (if any)
+            draft = {
+                'id': draft_id,
+                'publication': data.get('publication'),
+                'month': data.get('month'),
+                'year': data.get('year'),
+                'current_step': data.get('current_step', 1),
+                'data': data.get('data', {}),
+                'created_at': existing_draft.get('created_at', datetime.now().isoformat()),
+                'created_by': existing_draft.get('created_by', user_email),
+                'updated_at': datetime.now().isoformat()
+            }
+            set_summary_metadata(blob, draft)
+            return draft
 
-        draft = {
-            'id': draft_id,
-            'publication': data.get('publication'),
-            'month': data.get('month'),
-            'year': data.get('year'),
-            'current_step': data.get('current_step', 1),
-            'data': data.get('data', {}),
-            'created_at': existing_draft.get('created_at', datetime.now().isoformat()),
-            'created_by': existing_draft.get('created_by', user_email),
-            'updated_at': datetime.now().isoformat()
-        }
+        draft, _ = mutate_json_blob(blob, update, dict)
+        index_clickup_task(bucket, article_clickup_task_id(draft), draft_id)
+
+        return jsonify({
+            'success': True,
+            'draft_id': draft_id,
+            'message': 'Draft saved successfully'
+        })
 
-        # Save to GCS
-        blob.upload_from_string(json.dumps(draft, indent=2), content_type='application/json')
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+def load_json_blob(blob):
+    """Download and parse a JSON blob, or None if that fails"""
+    try:
+        return orjson.loads(blob.download_as_bytes())
+    except Exception:
+        return None
+
+def iter_json_records(bucket, prefix: str, fields: str = 'items(name),nextPageToken'):
+    """(blob, record) for every .json record under prefix. The listing only
+    asks for `fields`, and the bodies download concurrently; records that
+    fail to load are skipped."""
+    blobs = [blob for blob in bucket.list_blobs(prefix=prefix, page_size=1000, fields=fields)
+             if blob.name.endswith('.json')]
+    for blob, record in zip(blobs, io_pool.map(load_json_blob, blobs)):
+        if record is not None:
+            yield blob, record
+
+def backfill_summary_metadata(blob, record: dict) -> None:
+    """Attach summary metadata to a record saved before it existed"""
+    set_summary_metadata(blob, record)
+    if blob.metadata:
+        try:
+            # Only if the record hasn't been re-saved since it was downloaded
+            blob.patch(if_generation_match=blob.generation)
+        except Exception as e:
+            print(f"[WARNING] Could not backfill summary for {blob.name}: {e}")
+
+# The last summaries listed under each prefix, newest first, and the blob
+# generations they were built from
+_record_summaries = {}  # prefix -> (generations, summaries)
+
+def load_record_summaries(bucket, prefix: str, newest_by: str) -> list:
+    """Summaries of the .json records under prefix, newest first by the
+    newest_by field. Records saved with summary metadata come straight from
+    the listing; older ones are downloaded once and given the metadata in the
+    background so later listings skip them. While no record under prefix has
+    changed, the previous sorted list is returned as-is."""
+    blobs = [blob for blob in bucket.list_blobs(prefix=prefix,
+                                                fields='items(name,generation,metadata),nextPageToken')
+             if blob.name.endswith('.json')]
+    generations = tuple((blob.name, blob.generation) for blob in blobs)
+    cached = _record_summaries.get(prefix)
+    if cached and cached[0] == generations:
+        return cached[1]
+
+    summaries, missing = [], []
+    for blob in blobs:
+        raw = (blob.metadata or {}).get('summary')
+        if raw:
+            summaries.append(orjson.loads(raw))
+        else:
+            missing.append(blob)
 
-        return jsonify({
-            'success': True,
-            'draft_id': draft_id,
-            'message': 'Draft saved successfully'
-        })
+    for blob, record in zip(missing, io_pool.map(load_json_blob, missing)):
+        if record is None:
+            continue
+        try:
+            summaries.append(record_summary(record))
+        except Exception:
+            continue
+        io_pool.submit(backfill_summary_metadata, blob, record)
 
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    summaries.sort(key=lambda summary: summary.get(newest_by) or '', reverse=True)
+    _record_summaries[prefix] = (generations, summaries)
+    return summaries
 
 @app.route('/api/drafts/list', methods=['GET'])
 def list_drafts():
     """List all drafts from GCS"""
-    if not gcs_client:
+    bucket = get_gcs_bucket()
+    if bucket is None:
         return jsonify({'drafts': []})
 
     try:
-        bucket = gcs_client.bucket(GCS_BUCKET_NAME)
-        blobs = list(bucket.list_blobs(prefix='drafts/'))
-        drafts = []
-
-        for blob in blobs:
-            if blob.name.endswith('.json'):
-                try:
-                    draft = json.loads(blob.download_as_text())
-                    drafts.append({
-                        'id': draft.get('id'),
-                        'publication': draft.get('publication'),
-                        'month': draft.get('month'),
-                        'year': draft.get('year'),
-                        'current_step': draft.get('current_step'),
-                        'title': draft.get('data', {}).get('topic', {}).get('headline', 'Untitled'),
-                        'created_at': draft.get('created_at'),
-                        'created_by': draft.get('created_by', 'Unknown'),
-                        'updated_at': draft.get('updated_at')
-                    })
-                except Exception:
-                    continue
-
-        # Sort by updated_at descending
-        drafts.sort(key=lambda x: x.get('updated_at', ''), reverse=True)
+        drafts = [{
+            'id': draft.get('id'),
+            'publication': draft.get('publication'),
+            'month': draft.get('month'),
+            'year': draft.get('year'),
+            'current_step': draft.get('current_step'),
+            'title': draft.get('title'),
+            'created_at': draft.get('created_at'),
+            'created_by': draft.get('created_by', 'Unknown'),
+            'updated_at': draft.get('updated_at')
+        } for draft in load_record_summaries(bucket, 'drafts/', 'updated_at')]
 
         return jsonify({'drafts': drafts})
 
@@ -1231,18 +2012,18 @@ def list_drafts():
 @app.route('/api/drafts/<draft_id>', methods=['GET'])
 def get_draft(draft_id):
     """Get a specific draft from GCS"""
-    if not gcs_client:
+    bucket = get_gcs_bucket()
+    if bucket is None:
         return jsonify({'error': 'GCS not available'}), 503
 
     try:
-        bucket = gcs_client.bucket(GCS_BUCKET_NAME)
-        blob = bucket.blob(f"drafts/{draft_id}.json")
-
-        if not blob.exists():
+        try:
+            raw = bucket.blob(f"drafts/{draft_id}.json").download_as_bytes()
+        except NotFound:
             return jsonify({'error': 'Draft not found'}), 404
 
-        draft = json.loads(blob.download_as_text())
-        return jsonify(draft)
+        # Stored as the JSON object the client expects, so it goes out as is
+        return Response(raw, mimetype='application/json')
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -1250,15 +2031,17 @@ def get_draft(draft_id):
 @app.route('/api/drafts/<draft_id>', methods=['DELETE'])
 def delete_draft(draft_id):
     """Delete a draft from GCS"""
-    if not gcs_client:
+    bucket = get_gcs_bucket()
+    if bucket is None:
         return jsonify({'success': True})
 
     try:
-        bucket = gcs_client.bucket(GCS_BUCKET_NAME)
         blob = bucket.blob(f"drafts/{draft_id}.json")
 
-        if blob.exists():
+        try:
             blob.delete()
+        except NotFound:
+            pass
 
         return jsonify({'success': True, 'message': 'Draft deleted'})
 
@@ -1268,7 +2051,8 @@ def delete_draft(draft_id):
 @app.route('/api/projects/complete', methods=['POST'])
 def complete_project():
     """Move a draft to completed status in GCS"""
-    if not gcs_client:
+    bucket = get_gcs_bucket()
+    if bucket is None:
         return jsonify({'success': False, 'error': 'GCS not available'}), 503
 
     try:
@@ -1280,14 +2064,13 @@ def complete_project():
         current_user = get_current_user()
         user_email = current_user.get('email', 'Unknown') if current_user else 'Unknown'
 
-        bucket = gcs_client.bucket(GCS_BUCKET_NAME)
         source_blob = bucket.blob(f"drafts/{draft_id}.json")
 
-        if not source_blob.exists():
-            return jsonify({'success': False, 'error': 'Draft not found'}), 404
-
         # Read existing draft data
-        draft = json.loads(source_blob.download_as_text())
+        try:
+            draft = orjson.loads(source_blob.download_as_bytes())
+        except NotFound:
+            return jsonify({'success': False, 'error': 'Draft not found'}), 404
 
         # Add completion metadata
         draft['completed_at'] = datetime.now().isoformat()
@@ -1295,8 +2078,9 @@ def complete_project():
 
         # Write to completed/ prefix
         dest_blob = bucket.blob(f"completed/{draft_id}.json")
+        set_summary_metadata(dest_blob, draft)
         dest_blob.upload_from_string(
-            json.dumps(draft, indent=2),
+            orjson.dumps(draft),
             content_type='application/json'
         )
 
@@ -1315,39 +2099,25 @@ def complete_project():
 @app.route('/api/completed/list', methods=['GET'])
 def list_completed():
     """List completed articles from GCS, optionally filtered by publication"""
-    if not gcs_client:
+    bucket = get_gcs_bucket()
+    if bucket is None:
         return jsonify({'completed': []})
 
     try:
         publication_filter = request.args.get('publication')
 
-        bucket = gcs_client.bucket(GCS_BUCKET_NAME)
-        blobs = list(bucket.list_blobs(prefix='completed/'))
-        completed = []
-
-        for blob in blobs:
-            if blob.name.endswith('.json'):
-                try:
-                    article = json.loads(blob.download_as_text())
-
-                    if publication_filter and article.get('publication') != publication_filter:
-                        continue
-
-                    completed.append({
-                        'id': article.get('id'),
-                        'publication': article.get('publication'),
-                        'month': article.get('month'),
-                        'year': article.get('year'),
-                        'title': article.get('data', {}).get('topic', {}).get('headline', 'Untitled'),
-                        'created_at': article.get('created_at'),
-                        'created_by': article.get('created_by', 'Unknown'),
-                        'completed_at': article.get('completed_at'),
-                        'completed_by': article.get('completed_by', 'Unknown')
-                    })
-                except Exception:
-                    continue
-
-        completed.sort(key=lambda x: x.get('completed_at', ''), reverse=True)
+        completed = [{
+            'id': article.get('id'),
+            'publication': article.get('publication'),
+            'month': article.get('month'),
+            'year': article.get('year'),
+            'title': article.get('title'),
+            'created_at': article.get('created_at'),
+            'created_by': article.get('created_by', 'Unknown'),
+            'completed_at': article.get('completed_at'),
+            'completed_by': article.get('completed_by', 'Unknown')
+        } for article in load_record_summaries(bucket, 'completed/', 'completed_at')
+            if not publication_filter or article.get('publication') == publication_filter]
 
         return jsonify({'completed': completed})
 
@@ -1358,10 +2128,73 @@ def list_completed():
 # Routes - Topic Choice Logging (GCS)
 # ===================
 
+# Topic choices are queued in memory and written as one JSONL blob per batch
+# instead of one tiny object per click. A daemon thread flushes every
+# TOPIC_LOG_FLUSH_SECONDS or as soon as TOPIC_LOG_BATCH_SIZE entries wait;
+# whatever is left is flushed when the process exits. A batch that fails to
+# upload goes back on the queue for the next flush, keeping at most
+# TOPIC_LOG_MAX_QUEUED entries while GCS is failing.
+TOPIC_LOG_FLUSH_SECONDS = 30
+TOPIC_LOG_BATCH_SIZE = 500
+TOPIC_LOG_MAX_QUEUED = 10 * TOPIC_LOG_BATCH_SIZE
+_topic_log_queue = queue.Queue()
+_topic_log_batch_ready = threading.Event()
+_topic_log_flusher = None
+_topic_log_flusher_lock = threading.Lock()
+
+def flush_topic_logs() -> int:
+    """Upload every queued topic-choice entry as one JSONL blob"""
+    entries = []
+    while True:
+        try:
+            entries.append(_topic_log_queue.get_nowait())
+        except queue.Empty:
+            break
+    if not entries:
+        return 0
+    bucket = get_gcs_bucket()
+    if bucket is None:
+        return 0
+    try:
+        blob_name = f"topic-logs/{datetime.now().strftime('%Y-%m')}/batch-{uuid.uuid4()}.jsonl"
+        body = b"\n".join(orjson.dumps(entry) for entry in entries) + b"\n"
+        bucket.blob(blob_name).upload_from_string(body, content_type='application/x-ndjson')
+    except Exception as e:
+        # Requeue the newest entries that fit under the cap; the next flush retries them
+        room = TOPIC_LOG_MAX_QUEUED - _topic_log_queue.qsize()
+        kept = entries[-room:] if room > 0 else []
+        for entry in kept:
+            _topic_log_queue.put(entry)
+        dropped = len(entries) - len(kept)
+        print(f"[WARNING] Failed to flush {len(entries)} topic-choice logs, requeued {len(kept)}"
+              f"{f', dropped {dropped}' if dropped else ''}: {e}")
+        return 0
+    return len(entries)
+
+def _topic_log_flush_loop() -> None:
+    while True:
+        _topic_log_batch_ready.wait(TOPIC_LOG_FLUSH_SECONDS)
+        _topic_log_batch_ready.clear()
+        flush_topic_logs()
+
+def queue_topic_log(entry: dict) -> None:
+    """Queue a topic-choice entry, starting the flush thread on first use"""
+    global _topic_log_flusher
+    if _topic_log_flusher is None:
+        with _topic_log_flusher_lock:
+            if _topic_log_flusher is None:
+                _topic_log_flusher = threading.Thread(target=_topic_log_flush_loop, name='topic-log-flush', daemon=True)
+                _topic_log_flusher.start()
+    _topic_log_queue.put(entry)
+    if _topic_log_queue.qsize() >= TOPIC_LOG_BATCH_SIZE:
+        _topic_log_batch_ready.set()
+
+atexit.register(flush_topic_logs)
+
 @app.route('/api/log-topic-choice', methods=['POST'])
 def log_topic_choice():
     """Log a topic selection to GCS for future algorithm improvement"""
-    if not gcs_client:
+    if get_gcs_bucket() is None:
         return jsonify({'success': True})  # Silently skip if GCS unavailable
 
     try:
@@ -1369,7 +2202,7 @@ def log_topic_choice():
         current_user = get_current_user()
         user_email = current_user.get('email', 'Unknown') if current_user else data.get('user_email', 'Unknown')
 
-        log_entry = {
+        queue_topic_log({
             'timestamp': datetime.now().isoformat(),
             'user': user_email,
             'publication': data.get('publication'),
@@ -1380,12 +2213,7 @@ def log_topic_choice():
             'all_topics_shown': data.get('all_topics', []),
             'was_variation': data.get('was_variation', False),
             'original_topic': data.get('original_topic')
-        }
-
-        bucket = gcs_client.bucket(GCS_BUCKET_NAME)
-        blob_name = f"topic-logs/{datetime.now().strftime('%Y-%m')}/{uuid.uuid4()}.json"
-        blob = bucket.blob(blob_name)
-        blob.upload_from_string(json.dumps(log_entry, indent=2), content_type='application/json')
+        })
 
         return jsonify({'success': True})
 
@@ -1396,6 +2224,95 @@ def log_topic_choice():
 # Routes - Saved Topics (GCS) - Organized by Publication
 # ===================
 
+# Each publication's saved topics are a JSON list in their own blob under
+# SAVED_TOPICS_PREFIX, so saving or deleting a topic only moves that
+# publication's list. The Saved Topics view shows every publication: one
+# listing returns each blob's generation, and only blobs that changed since
+# they were cached are downloaded again.
+_saved_topics_cache = {}  # blob name -> (generation, raw JSON)
+_saved_topics_migrated = False
+# The serialized Saved Topics list, its ETag and the blob generations it was
+# built from
+_saved_topics_listing = (None, None, None)
+
+def saved_topics_blob(bucket, pub_key: str):
+    return bucket.blob(f"{SAVED_TOPICS_PREFIX}{pub_key}.json")
+
+def migrate_saved_topics(bucket) -> None:
+    """Split the legacy all-publications blob into per-publication blobs,
+    once per process and only until the split has completed. Each
+    publication's legacy topics are merged into its blob, so a blob that a
+    save created first (or a split that failed halfway) loses nothing; the
+    marker blob is written only after every publication is in."""
+    global _saved_topics_migrated
+    if _saved_topics_migrated:
+        return
+    if bucket.get_blob(SAVED_TOPICS_MIGRATED_BLOB) is None:
+        legacy = bucket.get_blob(SAVED_TOPICS_BLOB)
+        if legacy is not None:
+            for pub_key, legacy_topics in orjson.loads(legacy.download_as_bytes()).items():
+                def merge(topics, legacy_topics=legacy_topics):
+                    have = {headline_key(t.get('headline')) for t in topics}
+                    missing = [t for t in legacy_topics if headline_key(t.get('headline')) not in have]
+                    return missing + topics if missing else None
+                mutate_json_blob(saved_topics_blob(bucket, pub_key), merge, list,
+                                 dumps=lambda value: orjson.dumps(value, option=orjson.OPT_INDENT_2))
+            print(f"[GCS] Split {SAVED_TOPICS_BLOB} into per-publication blobs")
+        try:
+            bucket.blob(SAVED_TOPICS_MIGRATED_BLOB).upload_from_string(
+                b'', content_type='text/plain', if_generation_match=0)
+        except PreconditionFailed:
+            pass  # Another instance finished first
+    _saved_topics_migrated = True
+
+def saved_topics_listing(bucket) -> tuple:
+    """The Saved Topics list response body and its ETag: every publication's
+    topics, flattened and tagged with their publication. Rebuilt only when
+    one of the blobs changed; otherwise the last body is served as-is."""
+    global _saved_topics_listing
+    migrate_saved_topics(bucket)
+    blobs = [blob for blob in bucket.list_blobs(prefix=SAVED_TOPICS_PREFIX,
+                                                fields='items(name,generation),nextPageToken')
+             if blob.name.endswith('.json')]
+    generations = tuple((blob.name, blob.generation) for blob in blobs)
+    cached_generations, etag, body = _saved_topics_listing
+    if generations == cached_generations:
+        return body, etag
+
+    stale = [blob for blob in blobs
+             if _saved_topics_cache.get(blob.name, (None, None))[0] != blob.generation]
+    for blob, raw in zip(stale, io_pool.map(lambda blob: blob.download_as_bytes(), stale)):
+        _saved_topics_cache[blob.name] = (blob.generation, raw)
+
+    # Flatten across publications, ensuring each topic has its publication tagged
+    flat = []
+    for blob in blobs:
+        pub_key = blob.name[len(SAVED_TOPICS_PREFIX):-len('.json')]
+        for t in orjson.loads(_saved_topics_cache[blob.name][1]):
+            if not t.get('publication'):
+                t['publication'] = pub_key
+            flat.append(t)
+
+    body = orjson.dumps({'success': True, 'topics': flat})
+    etag = hashlib.sha1(repr(generations).encode()).hexdigest()
+    _saved_topics_listing = (generations, etag, body)
+    return body, etag
+
+def headline_key(headline) -> str:
+    """Saved-topic identity: the headline without case or surrounding whitespace"""
+    return (headline or '').strip().casefold()
+
+def update_publication_topics(bucket, pub_key: str, mutate) -> tuple:
+    """Apply mutate to one publication's saved topics (see mutate_json_blob)
+    and remember the result as the cached copy"""
+    migrate_saved_topics(bucket)
+    blob = saved_topics_blob(bucket, pub_key)
+    topics, raw = mutate_json_blob(blob, mutate, list,
+                                   dumps=lambda value: orjson.dumps(value, option=orjson.OPT_INDENT_2))
+    if raw is not None:
+        _saved_topics_cache[blob.name] = (blob.generation, raw)
+    return topics, raw is not None
+
 @app.route('/api/saved-topics/<publication>', methods=['GET'])
 def list_saved_topics(publication):
     """List saved topics across ALL publications from GCS.
@@ -1404,27 +2321,18 @@ def list_saved_topics(publication):
     saved topics now persist across publications so a topic saved under Forbes
     is visible from FastCo and Entrepreneur as well.
     """
-    if not gcs_client:
+    bucket = get_gcs_bucket()
+    if bucket is None:
         return jsonify({'success': True, 'topics': []})
 
     try:
-        bucket = gcs_client.bucket(GCS_BUCKET_NAME)
-        blob = bucket.blob(SAVED_TOPICS_BLOB)
-
-        if not blob.exists():
-            return jsonify({'success': True, 'topics': []})
-
-        all_topics = json.loads(blob.download_as_text())
-
-        # Flatten across publications, ensuring each topic has its publication tagged
-        flat = []
-        for pub_key, topics in all_topics.items():
-            for t in topics:
-                if not t.get('publication'):
-                    t['publication'] = pub_key
-                flat.append(t)
-
-        return jsonify({'success': True, 'topics': flat})
+        body, etag = saved_topics_listing(bucket)
+        resp = Response(body, mimetype='application/json')
+        resp.set_etag(etag)
+        # Always revalidate: an unchanged list costs the browser a 304
+        resp.cache_control.private = True
+        resp.cache_control.no_cache = True
+        return resp.make_conditional(request)
 
     except Exception as e:
         return jsonify({'success': False, 'error': str(e), 'topics': []})
@@ -1432,7 +2340,8 @@ def list_saved_topics(publication):
 @app.route('/api/saved-topics/<publication>', methods=['POST'])
 def save_topic(publication):
     """Save a topic for a specific publication"""
-    if not gcs_client:
+    bucket = get_gcs_bucket()
+    if bucket is None:
         return jsonify({'success': False, 'error': 'GCS not available'}), 503
 
     try:
@@ -1444,29 +2353,25 @@ def save_topic(publication):
         current_user = get_current_user()
         user_email = current_user.get('email', 'Unknown') if current_user else 'Unknown'
 
-        bucket = gcs_client.bucket(GCS_BUCKET_NAME)
-        blob = bucket.blob(SAVED_TOPICS_BLOB)
-
-        # Load existing topics (organized by publication)
-        all_topics = {}
-        if blob.exists():
-            all_topics = json.loads(blob.download_as_text())
 
         pub_key = publication.lower()
-        if pub_key not in all_topics:
-            all_topics[pub_key] = []
-
-        # Check if already saved (by headline)
-        if any(t.get('headline') == topic.get('headline') for t in all_topics[pub_key]):
-            return jsonify({'success': False, 'error': 'Topic already saved'})
 
         # Add metadata
         topic['savedAt'] = datetime.now().isoformat()
         topic['savedBy'] = user_email
         topic['publication'] = pub_key
 
-        all_topics[pub_key].append(topic)
-        blob.upload_from_string(json.dumps(all_topics, indent=2), content_type='application/json')
+        key = headline_key(topic['headline'])
+
+        def add(topics):
+            # Check if already saved (by headline, ignoring case and padding)
+            if key in {headline_key(t.get('headline')) for t in topics}:
+                return None
+            return topics + [topic]
+
+        _, added = update_publication_topics(bucket, pub_key, add)
+        if not added:
+            return jsonify({'success': False, 'error': 'Topic already saved'})
 
         return jsonify({'success': True, 'topic': topic})
 
@@ -1476,22 +2381,17 @@ def save_topic(publication):
 @app.route('/api/saved-topics/<publication>/<int:index>', methods=['DELETE'])
 def delete_saved_topic(publication, index):
     """Delete a saved topic by publication and index"""
-    if not gcs_client:
+    bucket = get_gcs_bucket()
+    if bucket is None:
         return jsonify({'success': True})
 
     try:
-        bucket = gcs_client.bucket(GCS_BUCKET_NAME)
-        blob = bucket.blob(SAVED_TOPICS_BLOB)
+        def remove(topics):
+            if 0 <= index < len(topics):
+                return topics[:index] + topics[index + 1:]
+            return None
 
-        if not blob.exists():
-            return jsonify({'success': True})
-
-        all_topics = json.loads(blob.download_as_text())
-        pub_key = publication.lower()
-
-        if pub_key in all_topics and 0 <= index < len(all_topics[pub_key]):
-            all_topics[pub_key].pop(index)
-            blob.upload_from_string(json.dumps(all_topics, indent=2), content_type='application/json')
+        update_publication_topics(bucket, publication.lower(), remove)
 
         return jsonify({'success': True})
 
@@ -1501,7 +2401,8 @@ def delete_saved_topic(publication, index):
 @app.route('/api/saved-topics/delete-by-headline', methods=['POST'])
 def delete_saved_topic_by_headline():
     """Delete a saved topic by publication + headline (works regardless of index)."""
-    if not gcs_client:
+    bucket = get_gcs_bucket()
+    if bucket is None:
         return jsonify({'success': True})
 
     try:
@@ -1511,16 +2412,13 @@ def delete_saved_topic_by_headline():
         if not pub_key or not headline:
             return jsonify({'success': False, 'error': 'publication and headline required'}), 400
 
-        bucket = gcs_client.bucket(GCS_BUCKET_NAME)
-        blob = bucket.blob(SAVED_TOPICS_BLOB)
+        key = headline_key(headline)
 
-        if not blob.exists():
-            return jsonify({'success': True})
+        def remove(topics):
+            remaining = [t for t in topics if headline_key(t.get('headline')) != key]
+            return remaining if len(remaining) != len(topics) else None
 
-        all_topics = json.loads(blob.download_as_text())
-        if pub_key in all_topics:
-            all_topics[pub_key] = [t for t in all_topics[pub_key] if t.get('headline') != headline]
-            blob.upload_from_string(json.dumps(all_topics, indent=2), content_type='application/json')
+        update_publication_topics(bucket, pub_key, remove)
 
         return jsonify({'success': True})
 
@@ -1531,103 +2429,87 @@ def delete_saved_topic_by_headline():
 # Routes - Google Docs Export
 # ===================
 
-import re
-from html.parser import HTMLParser
+# Character styles that are merged into combined updateTextStyle requests
+INLINE_STYLES = ('bold', 'italic', 'underline')
 
-class HTMLToDocsParser(HTMLParser):
-    """Parse HTML and convert to Google Docs formatting requests"""
+# Shared, read-only style payloads; every request for the same style points
+# at the same dict instead of building a new one per range
+HEADING_STYLES = {
+    'heading1': {'bold': True, 'fontSize': {'magnitude': 18, 'unit': 'PT'}},
+    'heading2': {'bold': True, 'fontSize': {'magnitude': 16, 'unit': 'PT'}},
+    'heading3': {'bold': True, 'fontSize': {'magnitude': 14, 'unit': 'PT'}},
+}
+LINK_COLOR = {'color': {'rgbColor': {'red': 0, 'green': 0.5, 'blue': 0.5}}}
+
+class DocsBuilder:
+    """lxml parser target that turns HTML into plain text plus the
+    formatting ranges needed for Google Docs requests"""
 
     def __init__(self):
-        super().__init__()
-        self.text = ""
+        self._chunks = []
+        self._len = 0
+        self._last_is_nl = False
+        self.text = ''
         self.formatting_ranges = []
-        self.current_pos = 0
         self.tag_stack = []
         self.link_url = None
         self.list_stack = []
 
-    def handle_starttag(self, tag, attrs):
-        attrs_dict = dict(attrs)
-        if tag in ['strong', 'b']:
-            self.tag_stack.append(('bold', len(self.text)))
-        elif tag in ['em', 'i']:
-            self.tag_stack.append(('italic', len(self.text)))
-        elif tag == 'u':
-            self.tag_stack.append(('underline', len(self.text)))
-        elif tag == 'a':
-            self.link_url = attrs_dict.get('href', '')
-            self.tag_stack.append(('link', len(self.text)))
-        elif tag == 'h1':
-            if self.text and not self.text.endswith('\n'):
-                self.text += '\n'
-            self.tag_stack.append(('heading1', len(self.text)))
-        elif tag == 'h2':
-            self.tag_stack.append(('heading2', len(self.text)))
-        elif tag == 'h3':
-            self.tag_stack.append(('heading3', len(self.text)))
-        elif tag == 'br':
-            self.text += '\n'
-        elif tag == 'p':
-            if self.text and not self.text.endswith('\n'):
-                self.text += '\n'
-        elif tag in ['ul', 'ol']:
-            if self.text and not self.text.endswith('\n'):
-                self.text += '\n'
-            self.list_stack.append({'type': tag, 'count': 0})
-        elif tag == 'li':
-            if self.text and not self.text.endswith('\n'):
-                self.text += '\n'
-            if self.list_stack and self.list_stack[-1]['type'] == 'ol':
-                self.list_stack[-1]['count'] += 1
-                self.text += f"{self.list_stack[-1]['count']}. "
-            else:
-                self.text += '• '
-        elif tag == 'blockquote':
-            self.tag_stack.append(('blockquote', len(self.text)))
-
-    def handle_endtag(self, tag):
-        if tag in ['strong', 'b']:
-            self._close_tag('bold')
-        elif tag in ['em', 'i']:
-            self._close_tag('italic')
-        elif tag == 'u':
-            self._close_tag('underline')
-        elif tag == 'a':
-            self._close_tag('link')
-            self.link_url = None
-        elif tag == 'h1':
-            self._close_tag('heading1')
-            if not self.text.endswith('\n'):
-                self.text += '\n'
-        elif tag == 'h2':
-            self._close_tag('heading2')
-            if not self.text.endswith('\n'):
-                self.text += '\n'
-        elif tag == 'h3':
-            self._close_tag('heading3')
-            if not self.text.endswith('\n'):
-                self.text += '\n'
-        elif tag in ['p', 'div']:
-            if not self.text.endswith('\n'):
-                self.text += '\n'
-        elif tag in ['ul', 'ol']:
-            if self.list_stack:
-                self.list_stack.pop()
-            if not self.text.endswith('\n'):
-                self.text += '\n'
-        elif tag == 'li':
-            if not self.text.endswith('\n'):
-                self.text += '\n'
-        elif tag == 'blockquote':
-            self._close_tag('blockquote')
-            if not self.text.endswith('\n'):
-                self.text += '\n'
+    def _emit(self, s):
+        if s:
+            self._chunks.append(s)
+            self._len += len(s)
+            self._last_is_nl = s[-1] == '\n'
+
+    def start(self, tag, attrs):
+        handler = _DOCS_START_HANDLERS.get(tag)
+        if handler:
+            handler(self, tag, attrs)
+
+    def end(self, tag):
+        handler = _DOCS_END_HANDLERS.get(tag)
+        if handler:
+            handler(self, tag)
+
+    def _open_line(self):
+        """Start a new line unless at the very start or already on one"""
+        if self._len and not self._last_is_nl:
+            self._emit('\n')
+
+    def _close_line(self):
+        if not self._last_is_nl:
+            self._emit('\n')
+
+    def _start_link(self, tag, attrs):
+        self.link_url = attrs.get('href', '')
+        self.tag_stack.append(('link', self._len))
+
+    def _end_link(self, tag):
+        self._close_tag('link')
+        self.link_url = None
+
+    def _start_list(self, tag, attrs):
+        self._open_line()
+        self.list_stack.append({'type': tag, 'count': 0})
+
+    def _end_list(self, tag):
+        if self.list_stack:
+            self.list_stack.pop()
+        self._close_line()
+
+    def _start_list_item(self, tag, attrs):
+        self._open_line()
+        if self.list_stack and self.list_stack[-1]['type'] == 'ol':
+            self.list_stack[-1]['count'] += 1
+            self._emit(f"{self.list_stack[-1]['count']}. ")
+        else:
+            self._emit('• ')
 
     def _close_tag(self, tag_type):
         for i in range(len(self.tag_stack) - 1, -1, -1):
             if self.tag_stack[i][0] == tag_type:
                 _, start = self.tag_stack.pop(i)
-                end = len(self.text)
+                end = self._len
                 if end > start:
                     self.formatting_ranges.append({
                         'type': tag_type,
@@ -1637,100 +2519,143 @@ class HTMLToDocsParser(HTMLParser):
                     })
                 break
 
-    def handle_data(self, data):
-        self.text += data
+    def data(self, data):
+        self._emit(data)
+
+    def close(self):
+        self.text = ''.join(self._chunks)
+        return self
+
+    def _inline_style_requests(self, start_index):
+        """One updateTextStyle per distinct span, carrying every inline style
+        on it; overlapping or touching ranges of the same style are merged"""
+        spans = {}
+        for style in INLINE_STYLES:
+            merged = []
+            for start, end in sorted((fmt['start'], fmt['end']) for fmt in self.formatting_ranges
+                                     if fmt['type'] == style):
+                if merged and start <= merged[-1][1]:
+                    merged[-1][1] = max(merged[-1][1], end)
+                else:
+                    merged.append([start, end])
+            for start, end in merged:
+                spans.setdefault((start, end), []).append(style)
+
+        return [{
+            'updateTextStyle': {
+                'range': {'startIndex': start_index + start, 'endIndex': start_index + end},
+                'textStyle': {style: True for style in styles},
+                'fields': ','.join(styles)
+            }
+        } for (start, end), styles in sorted(spans.items())]
 
     def get_docs_requests(self, start_index=1):
         """Convert formatting ranges to Google Docs API requests"""
-        requests = []
+        requests = self._inline_style_requests(start_index)
 
         for fmt in self.formatting_ranges:
             start = start_index + fmt['start']
             end = start_index + fmt['end']
 
-            if fmt['type'] == 'bold':
-                requests.append({
-                    'updateTextStyle': {
-                        'range': {'startIndex': start, 'endIndex': end},
-                        'textStyle': {'bold': True},
-                        'fields': 'bold'
-                    }
-                })
-            elif fmt['type'] == 'italic':
-                requests.append({
-                    'updateTextStyle': {
-                        'range': {'startIndex': start, 'endIndex': end},
-                        'textStyle': {'italic': True},
-                        'fields': 'italic'
-                    }
-                })
-            elif fmt['type'] == 'underline':
+            if fmt['type'] == 'link' and fmt['url']:
                 requests.append({
                     'updateTextStyle': {
                         'range': {'startIndex': start, 'endIndex': end},
-                        'textStyle': {'underline': True},
-                        'fields': 'underline'
-                    }
-                })
-            elif fmt['type'] == 'link' and fmt['url']:
-                requests.append({
-                    'updateTextStyle': {
-                        'range': {'startIndex': start, 'endIndex': end},
-                        'textStyle': {
-                            'link': {'url': fmt['url']},
-                            'foregroundColor': {'color': {'rgbColor': {'red': 0, 'green': 0.5, 'blue': 0.5}}}
-                        },
+                        'textStyle': {'link': {'url': fmt['url']}, 'foregroundColor': LINK_COLOR},
                         'fields': 'link,foregroundColor'
                     }
                 })
-            elif fmt['type'] == 'heading1':
-                requests.append({
-                    'updateTextStyle': {
-                        'range': {'startIndex': start, 'endIndex': end},
-                        'textStyle': {'bold': True, 'fontSize': {'magnitude': 18, 'unit': 'PT'}},
-                        'fields': 'bold,fontSize'
-                    }
-                })
-            elif fmt['type'] == 'heading2':
-                requests.append({
-                    'updateTextStyle': {
-                        'range': {'startIndex': start, 'endIndex': end},
-                        'textStyle': {'bold': True, 'fontSize': {'magnitude': 16, 'unit': 'PT'}},
-                        'fields': 'bold,fontSize'
-                    }
-                })
-            elif fmt['type'] == 'heading3':
+            elif fmt['type'] in HEADING_STYLES:
                 requests.append({
                     'updateTextStyle': {
                         'range': {'startIndex': start, 'endIndex': end},
-                        'textStyle': {'bold': True, 'fontSize': {'magnitude': 14, 'unit': 'PT'}},
+                        'textStyle': HEADING_STYLES[fmt['type']],
                         'fields': 'bold,fontSize'
                     }
                 })
 
         return requests
 
+def _open_range(tag_type, new_line=False):
+    def handler(builder, tag, attrs):
+        if new_line:
+            builder._open_line()
+        builder.tag_stack.append((tag_type, builder._len))
+    return handler
+
+def _close_range(tag_type, end_line=False):
+    def handler(builder, tag):
+        builder._close_tag(tag_type)
+        if end_line:
+            builder._close_line()
+    return handler
+
+# Tag -> handler tables for DocsBuilder; tags not listed only contribute text
+_DOCS_START_HANDLERS = {
+    'strong': _open_range('bold'),
+    'b': _open_range('bold'),
+    'em': _open_range('italic'),
+    'i': _open_range('italic'),
+    'u': _open_range('underline'),
+    'a': DocsBuilder._start_link,
+    'h1': _open_range('heading1', new_line=True),
+    'h2': _open_range('heading2'),
+    'h3': _open_range('heading3'),
+    'br': lambda builder, tag, attrs: builder._emit('\n'),
+    'p': lambda builder, tag, attrs: builder._open_line(),
+    'ul': DocsBuilder._start_list,
+    'ol': DocsBuilder._start_list,
+    'li': DocsBuilder._start_list_item,
+    'blockquote': _open_range('blockquote'),
+}
+
+_DOCS_END_HANDLERS = {
+    'strong': _close_range('bold'),
+    'b': _close_range('bold'),
+    'em': _close_range('italic'),
+    'i': _close_range('italic'),
+    'u': _close_range('underline'),
+    'a': DocsBuilder._end_link,
+    'h1': _close_range('heading1', end_line=True),
+    'h2': _close_range('heading2', end_line=True),
+    'h3': _close_range('heading3', end_line=True),
+    'p': lambda builder, tag: builder._close_line(),
+    'div': lambda builder, tag: builder._close_line(),
+    'ul': DocsBuilder._end_list,
+    'ol': DocsBuilder._end_list,
+    'li': lambda builder, tag: builder._close_line(),
+    'blockquote': _close_range('blockquote', end_line=True),
+}
+
+HTML_FEED_CHUNK = 32 * 1024
+
 def parse_html_for_docs(html_content):
-    """Parse HTML content and return text + formatting requests"""
+    """Parse HTML content (str or UTF-8 bytes) and return text + formatting requests"""
     if not html_content:
         return None, []
 
-    parser = HTMLToDocsParser()
     try:
-        parser.feed(html_content)
-        return parser.text, parser
+        # Fed in slices so lxml never holds a second, re-encoded copy of
+        # the whole document
+        parser = etree.HTMLParser(target=DocsBuilder(), encoding='utf-8')
+        for i in range(0, len(html_content), HTML_FEED_CHUNK):
+            parser.feed(html_content[i:i + HTML_FEED_CHUNK])
+        builder = parser.close()
+        return builder.text, builder
     except Exception as e:
         print(f"HTML parsing error: {e}")
         return None, None
 
+PUB_DISPLAY_NAMES = {
+    'forbes': 'Forbes',
+    'entrepreneur': 'Entrepreneur',
+    'fastcompany': 'Fast Company'
+}
+
+@lru_cache(maxsize=64)
 def get_pub_display_name(pub_key):
     """Get display name for publication"""
-    names = {
-        'forbes': 'Forbes',
-        'entrepreneur': 'Entrepreneur',
-        'fastcompany': 'Fast Company'
-    }
-    return names.get(pub_key.lower(), pub_key)
+    return PUB_DISPLAY_NAMES.get(pub_key.lower(), pub_key)
 
 def format_doc_title(year, month, publication, doc_type):
     """Format document title: Year Month Publication Type"""
@@ -1743,8 +2668,7 @@ def markdown_to_html(md_text):
     if not md_text:
         return ''
     try:
-        import markdown as _md
-        html = _md.markdown(md_text, extensions=['extra', 'sane_lists'])
+        html = markdown.markdown(md_text, extensions=['extra', 'sane_lists'])
     except Exception as e:
         print(f"[DOCS] markdown conversion failed ({e}); wrapping as plain paragraphs")
         paras = [p.strip() for p in md_text.split('\n\n') if p.strip()]
@@ -1753,29 +2677,74 @@ def markdown_to_html(md_text):
     return html.replace('<h1>', '<h2>').replace('</h1>', '</h2>')
 
 
+def write_google_doc(folder_id, title, text, formatting_requests=()):
+    """Create a Doc in folder_id holding text, styled by formatting_requests,
+    and share it read-only by link. Returns (doc_id, formatting_applied).
+
+    Three round-trips: create, then the content write and the sharing call
+    concurrently (they only need the new doc ID). The create doubles as the
+    folder access check."""
+    with google_docs_services() as (docs_service, drive_service):
+        return _write_google_doc(docs_service, drive_service, folder_id, title, text, formatting_requests)
+
+
+def _write_google_doc(docs_service, drive_service, folder_id, title, text, formatting_requests):
+    try:
+        doc = drive_service.files().create(
+            body={'name': title, 'mimeType': 'application/vnd.google-apps.document', 'parents': [folder_id]},
+            fields='id', supportsAllDrives=True
+        ).execute()
+    except Exception as folder_err:
+        raise RuntimeError(
+            f"Cannot access Google Drive folder. Ensure the service account has access. "
+            f"Folder ID: {folder_id}. Error: {folder_err}") from folder_err
+    doc_id = doc.get('id')
+
+    # The Docs and Drive services hold separate HTTP connections, so sharing
+    # can run while the content is written
+    shared = io_pool.submit(drive_service.permissions().create(
+        fileId=doc_id, body={'type': 'anyone', 'role': 'reader'}, supportsAllDrives=True
+    ).execute)
+
+    insert = [{'insertText': {'location': {'index': 1}, 'text': text}}]
+    formatting_applied = False
+    try:
+        if formatting_requests:
+            # Text and styling in one batchUpdate; if the styling is rejected
+            # the whole batch is, so fall back to the plain text
+            try:
+                docs_service.documents().batchUpdate(
+                    documentId=doc_id, body={'requests': insert + list(formatting_requests)}
+                ).execute()
+                formatting_applied = True
+            except Exception as fmt_err:
+                print(f"[DOCS] Formatting error (continuing without it): {fmt_err}")
+        if not formatting_applied:
+            docs_service.documents().batchUpdate(
+                documentId=doc_id, body={'requests': insert}
+            ).execute()
+    finally:
+        # The Drive service goes back to the pool with this export, so the
+        # sharing call has to be finished even if the write failed
+        wait([shared])
+
+    shared.result()
+
+    return doc_id, formatting_applied
+
+
 def create_google_doc(publication, month, year, text_content, article_html=None, is_final=False):
     """Create a Google Doc for an article and return an info dict. Callable
     internally (mirrors /api/export-to-docs). Raises on error."""
-    docs_service, drive_service = get_google_docs_service()
-
     doc_type = 'Final' if is_final else 'Draft'
     title = format_doc_title(year, month, publication, doc_type)
 
-    pub_key = (publication or '').lower().replace(' ', '')
+    pub_key = pub_key_for(publication)
     folder_type = 'finals' if is_final else 'drafts'
     folder_id = FOLDER_IDS.get(pub_key, {}).get(folder_type)
     if not folder_id:
         raise ValueError(f'Folder ID not configured for {pub_key}/{folder_type}')
 
-    # Verify folder access (supports Shared Drives)
-    drive_service.files().get(fileId=folder_id, fields='id, name', supportsAllDrives=True).execute()
-
-    doc = drive_service.files().create(
-        body={'name': title, 'mimeType': 'application/vnd.google-apps.document', 'parents': [folder_id]},
-        fields='id', supportsAllDrives=True
-    ).execute()
-    doc_id = doc.get('id')
-
     final_text = text_content
     formatting_requests = []
     if article_html:
@@ -1784,29 +2753,14 @@ def create_google_doc(publication, month, year, text_content, article_html=None,
             final_text = parsed_text
             formatting_requests = parser.get_docs_requests(start_index=1)
 
-    docs_service.documents().batchUpdate(
-        documentId=doc_id,
-        body={'requests': [{'insertText': {'location': {'index': 1}, 'text': final_text}}]}
-    ).execute()
-
-    if formatting_requests:
-        try:
-            docs_service.documents().batchUpdate(
-                documentId=doc_id, body={'requests': formatting_requests}
-            ).execute()
-        except Exception as fmt_err:
-            print(f"[DOCS] Formatting error (continuing): {fmt_err}")
-
-    drive_service.permissions().create(
-        fileId=doc_id, body={'type': 'anyone', 'role': 'reader'}, supportsAllDrives=True
-    ).execute()
+    doc_id, formatting_applied = write_google_doc(folder_id, title, final_text, formatting_requests)
 
     return {
         'doc_id': doc_id,
         'doc_url': f"https://docs.google.com/document/d/{doc_id}/edit",
         'title': title,
         'folder': folder_type,
-        'formatting_applied': bool(formatting_requests),
+        'formatting_applied': formatting_applied,
     }
 
 
@@ -1824,28 +2778,13 @@ def export_transcription():
         return jsonify({'error': 'No transcription provided'}), 400
 
     try:
-        docs_service, drive_service = get_google_docs_service()
-
         # Use drafts folder for transcriptions
-        pub_key = publication.lower().replace(' ', '')
+        pub_key = pub_key_for(publication)
         folder_id = FOLDER_IDS.get(pub_key, {}).get('drafts')
 
         if not folder_id:
             return jsonify({'error': 'Folder ID not configured'}), 400
 
-        # Verify folder access first (supports Shared Drives)
-        try:
-            folder_check = drive_service.files().get(
-                fileId=folder_id,
-                fields='id, name',
-                supportsAllDrives=True
-            ).execute()
-            print(f"[API] Folder access OK: {folder_check.get('name')}")
-        except Exception as folder_err:
-            return jsonify({
-                'error': f"Cannot access Google Drive folder. Ensure the service account has access. Folder ID: {folder_id}. Error: {str(folder_err)}"
-            }), 500
-
         # Format title: Year Month Publication Transcribed Audio
         title = format_doc_title(year, month, publication, 'Transcribed Audio')
 
@@ -1857,41 +2796,8 @@ def export_transcription():
         content += "=" * 50 + "\n\n"
         content += transcription
 
-        # Create the document (supports Shared Drives)
-        doc_metadata = {
-            'name': title,
-            'mimeType': 'application/vnd.google-apps.document',
-            'parents': [folder_id]
-        }
-
-        doc = drive_service.files().create(
-            body=doc_metadata,
-            fields='id',
-            supportsAllDrives=True
-        ).execute()
-        doc_id = doc.get('id')
-
-        # Add content to document
-        requests_list = [
-            {
-                'insertText': {
-                    'location': {'index': 1},
-                    'text': content
-                }
-            }
-        ]
-
-        docs_service.documents().batchUpdate(
-            documentId=doc_id,
-            body={'requests': requests_list}
-        ).execute()
-
-        # Make document accessible (supports Shared Drives)
-        drive_service.permissions().create(
-            fileId=doc_id,
-            body={'type': 'anyone', 'role': 'reader'},
-            supportsAllDrives=True
-        ).execute()
+        # Create, fill and share the document (supports Shared Drives)
+        doc_id, _ = write_google_doc(folder_id, title, content)
 
         doc_url = f"https://docs.google.com/document/d/{doc_id}/edit"
 
@@ -1921,43 +2827,14 @@ def export_to_docs():
     title = format_doc_title(year, month, publication, doc_type)
 
     try:
-        docs_service, drive_service = get_google_docs_service()
-
         # Determine folder
-        pub_key = publication.lower().replace(' ', '')
+        pub_key = pub_key_for(publication)
         folder_type = 'finals' if is_final else 'drafts'
         folder_id = FOLDER_IDS.get(pub_key, {}).get(folder_type)
 
         if not folder_id:
             return jsonify({'error': 'Folder ID not configured'}), 400
 
-        # Verify folder access first (supports Shared Drives)
-        try:
-            folder_check = drive_service.files().get(
-                fileId=folder_id,
-                fields='id, name',
-                supportsAllDrives=True
-            ).execute()
-            print(f"[API] Folder access OK: {folder_check.get('name')}")
-        except Exception as folder_err:
-            return jsonify({
-                'error': f"Cannot access Google Drive folder. Ensure the service account has access. Folder ID: {folder_id}. Error: {str(folder_err)}"
-            }), 500
-
-        # Create the document (supports Shared Drives)
-        doc_metadata = {
-            'name': title,
-            'mimeType': 'application/vnd.google-apps.document',
-            'parents': [folder_id]
-        }
-
-        doc = drive_service.files().create(
-            body=doc_metadata,
-            fields='id',
-            supportsAllDrives=True
-        ).execute()
-        doc_id = doc.get('id')
-
         # Parse HTML for formatting if available
         text_content = article
         formatting_requests = []
@@ -1968,38 +2845,10 @@ def export_to_docs():
                 text_content = parsed_text
                 formatting_requests = parser.get_docs_requests(start_index=1)
 
-        # Add content to document
-        requests_list = [
-            {
-                'insertText': {
-                    'location': {'index': 1},
-                    'text': text_content
-                }
-            }
-        ]
-
-        docs_service.documents().batchUpdate(
-            documentId=doc_id,
-            body={'requests': requests_list}
-        ).execute()
-
-        # Apply formatting if available
-        if formatting_requests:
-            try:
-                docs_service.documents().batchUpdate(
-                    documentId=doc_id,
-                    body={'requests': formatting_requests}
-                ).execute()
-                print(f"[API] Applied {len(formatting_requests)} formatting requests")
-            except Exception as fmt_err:
-                print(f"[API] Formatting error (continuing): {fmt_err}")
-
-        # Make document accessible (supports Shared Drives)
-        drive_service.permissions().create(
-            fileId=doc_id,
-            body={'type': 'anyone', 'role': 'reader'},
-            supportsAllDrives=True
-        ).execute()
+        # Create, fill, format and share the document (supports Shared Drives)
+        doc_id, formatting_applied = write_google_doc(folder_id, title, text_content, formatting_requests)
+        if formatting_applied:
+            print(f"[API] Applied {len(formatting_requests)} formatting requests")
 
         doc_url = f"https://docs.google.com/document/d/{doc_id}/edit"
 
@@ -2009,7 +2858,7 @@ def export_to_docs():
             'doc_url': doc_url,
             'title': title,
             'folder': folder_type,
-            'formatting_applied': len(formatting_requests) > 0
+            'formatting_applied': formatting_applied
         })
 
     except Exception as e:
@@ -2019,6 +2868,50 @@ def export_to_docs():
 # Routes - Email Notifications
 # ===================
 
+# Compiled once; autoescaping keeps user-supplied titles and URLs from
+# injecting markup into the email.
+NOTIFICATION_EMAIL_TEMPLATE = Template("""\
+<!DOCTYPE html>
+<html>
+<head>
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+        .container { max-width: 600px; margin: 0 auto; padding: 20px; }
+        .header { background: #008181; color: white; padding: 20px; text-align: center; border-radius: 8px 8px 0 0; }
+        .content { background: #f9f9f9; padding: 30px; border-radius: 0 0 8px 8px; }
+        .status { display: inline-block; background: {{ status_color }}; color: white; padding: 5px 15px; border-radius: 20px; font-weight: bold; }
+        .button { display: inline-block; background: #008181; color: white; padding: 12px 30px; text-decoration: none; border-radius: 8px; margin-top: 20px; }
+        .details { background: white; padding: 15px; border-radius: 8px; margin: 20px 0; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1 style="margin: 0;">CEO Article Generator</h1>
+            <p style="margin: 10px 0 0 0;">BriteCo Thought Leadership</p>
+        </div>
+        <div class="content">
+            <p class="status">{{ status_text }}</p>
+
+            <div class="details">
+                <p><strong>Publication:</strong> {{ pub_display_name }}</p>
+                <p><strong>Month:</strong> {{ month }} {{ year }}</p>
+                <p><strong>Title:</strong> {{ title }}</p>
+            </div>
+
+            <p>{% if is_final %}This draft has been finalized and saved to the Finals folder.{% else %}Please review this draft and make any necessary edits.{% endif %}</p>
+
+            <a href="{{ doc_url }}" class="button" style="color: white;">Open in Google Docs</a>
+
+            <p style="margin-top: 30px; font-size: 12px; color: #666;">
+                This email was sent by the CEO Article Generator tool.
+            </p>
+        </div>
+    </div>
+</body>
+</html>
+""", autoescape=True)
+
 @app.route('/api/send-notification', methods=['POST'])
 def send_notification():
     """Send email notification"""
@@ -2032,10 +2925,9 @@ def send_notification():
     custom_recipients = data.get('recipients')  # Custom recipients from frontend
 
     try:
-        import sendgrid
         from sendgrid.helpers.mail import Mail
 
-        sg = sendgrid.SendGridAPIClient(api_key=os.environ.get('SENDGRID_API_KEY'))
+        sg = get_sendgrid_client()
 
         # Use custom recipients if provided, otherwise fall back to defaults
         if custom_recipients and len(custom_recipients) > 0:
@@ -2056,70 +2948,38 @@ def send_notification():
             status_text = "DRAFT - Ready for Review"
             status_color = "#FE8916"
 
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-                .header {{ background: #008181; color: white; padding: 20px; text-align: center; border-radius: 8px 8px 0 0; }}
-                .content {{ background: #f9f9f9; padding: 30px; border-radius: 0 0 8px 8px; }}
-                .status {{ display: inline-block; background: {status_color}; color: white; padding: 5px 15px; border-radius: 20px; font-weight: bold; }}
-                .button {{ display: inline-block; background: #008181; color: white; padding: 12px 30px; text-decoration: none; border-radius: 8px; margin-top: 20px; }}
-                .details {{ background: white; padding: 15px; border-radius: 8px; margin: 20px 0; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1 style="margin: 0;">CEO Article Generator</h1>
-                    <p style="margin: 10px 0 0 0;">BriteCo Thought Leadership</p>
-                </div>
-                <div class="content">
-                    <p class="status">{status_text}</p>
-
-                    <div class="details">
-                        <p><strong>Publication:</strong> {pub_display_name}</p>
-                        <p><strong>Month:</strong> {month} {year}</p>
-                        <p><strong>Title:</strong> {title}</p>
-                    </div>
-
-                    <p>{"This draft has been finalized and saved to the Finals folder." if notification_type == 'final' else "Please review this draft and make any necessary edits."}</p>
-
-                    <a href="{doc_url}" class="button" style="color: white;">Open in Google Docs</a>
-
-                    <p style="margin-top: 30px; font-size: 12px; color: #666;">
-                        This email was sent by the CEO Article Generator tool.
-                    </p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-
-        # Send to each recipient
-        sent_count = 0
-        errors = []
+        html_content = NOTIFICATION_EMAIL_TEMPLATE.render(
+            status_text=status_text,
+            status_color=status_color,
+            pub_display_name=pub_display_name,
+            month=month,
+            year=year,
+            title=title,
+            doc_url=doc_url,
+            is_final=notification_type == 'final'
+        )
 
-        for recipient in recipients:
+        def send_to(recipient):
+            """Send one email; returns an error message, or None on success"""
             try:
                 message = Mail(
-                    from_email=(
-                        os.environ.get('SENDGRID_FROM_EMAIL', 'marketing@brite.co'),
-                        os.environ.get('SENDGRID_FROM_NAME', 'BriteCo CEO Articles')
-                    ),
+                    from_email=SENDGRID_FROM,
                     to_emails=recipient.strip(),
                     subject=subject,
                     html_content=html_content
                 )
                 response = sg.send(message)
                 if response.status_code in [200, 201, 202]:
-                    sent_count += 1
-                else:
-                    errors.append(f"Failed for {recipient}: status {response.status_code}")
+                    return None
+                return f"Failed for {recipient}: status {response.status_code}"
             except Exception as e:
-                errors.append(f"Failed for {recipient}: {str(e)}")
+                return f"Failed for {recipient}: {str(e)}"
+
+        # Each recipient gets its own SendGrid call; they're independent, so
+        # send them concurrently instead of one round-trip after another
+        results = list(io_pool.map(send_to, recipients))
+        errors = [error for error in results if error]
+        sent_count = len(results) - len(errors)
 
         return jsonify({
             'success': True,
@@ -2143,15 +3003,12 @@ def clickup_request(method, path, json_data=None):
         return False, {'error': 'ClickUp not configured'}
 
     try:
-        url = f"https://api.clickup.com/api/v2{path}"
-        headers = {
-            'Authorization': CLICKUP_API_TOKEN,
-            'Content-Type': 'application/json'
-        }
-        resp = http_requests.request(method, url, headers=headers, json=json_data, timeout=10)
+        body = orjson.dumps(json_data) if json_data is not None else None
+        resp = http_session.request(method, f"{CLICKUP_API_BASE}{path}", headers=CLICKUP_HEADERS,
+                                    data=body, timeout=(3, 10))
 
         if resp.status_code in (200, 201):
-            return True, resp.json()
+            return True, orjson.loads(resp.content)
         else:
             print(f"[CLICKUP] API error {resp.status_code}: {resp.text[:300]}")
             return False, {'error': f"ClickUp API returned {resp.status_code}"}
@@ -2260,11 +3117,94 @@ def setup_clickup_webhook():
     })
 
     if ok:
-        return jsonify({'success': True, 'webhook_id': data.get('webhook', {}).get('id'), 'endpoint': webhook_url})
+        webhook_id = data.get('webhook', {}).get('id')
+        # The signing secret stays out of the response; the operator copies it
+        # from ClickUp into the deployment's environment
+        print(f"[CLICKUP] Registered webhook {webhook_id}; set CLICKUP_WEBHOOK_SECRET to its "
+              f"'secret' from GET {CLICKUP_API_BASE}/team/{team_id}/webhook so deliveries are verified")
+        return jsonify({'success': True, 'webhook_id': webhook_id, 'endpoint': webhook_url})
     else:
         return jsonify({'success': False, 'error': data}), 500
 
 
+# ClickUp task id -> id of the draft/completed record it belongs to. Records
+# keep their id when completed, so one index entry covers both prefixes and
+# a webhook reads the index plus one record instead of every record.
+# 'complete' marks that the index has been seeded from the records saved
+# before it existed; after that a missing task means there is no article.
+CLICKUP_INDEX_BLOB = 'indexes/clickup_task_id.json'
+_clickup_indexed = {}  # task_id -> article id this process has already indexed
+_clickup_index = None  # {task_id: article_id} as this process last read it
+
+def article_clickup_task_id(article: dict):
+    # task id is persisted at data.clickup_task_id; check top-level too
+    return (article.get('data', {}) or {}).get('clickup_task_id') or article.get('clickup_task_id')
+
+def index_clickup_task(bucket, task_id, article_id) -> None:
+    """Point task_id at article_id in the task index"""
+    if not task_id or _clickup_indexed.get(task_id) == article_id:
+        return
+
+    def update(index):
+        tasks = index.setdefault('tasks', {})
+        if tasks.get(task_id) == article_id:
+            return None
+        tasks[task_id] = article_id
+        return index
+
+    try:
+        mutate_json_blob(bucket.blob(CLICKUP_INDEX_BLOB), update, dict)
+        _clickup_indexed[task_id] = article_id
+        if _clickup_index is not None:
+            _clickup_index[task_id] = article_id
+    except Exception as e:
+        print(f"[WARNING] Could not index ClickUp task {task_id}: {e}")
+
+def load_clickup_index(bucket) -> dict:
+    """The task index as {task_id: article_id}, seeding it from a scan of
+    every record the first time it's needed"""
+    global _clickup_index
+    try:
+        index = orjson.loads(bucket.blob(CLICKUP_INDEX_BLOB).download_as_bytes())
+    except NotFound:
+        index = {}
+    if index.get('complete'):
+        _clickup_index = index.get('tasks', {})
+        return _clickup_index
+
+    print("[CLICKUP] Seeding the task index from saved records")
+    scanned = {}
+    def list_records(prefix):
+        return [blob for blob in bucket.list_blobs(prefix=prefix, page_size=1000,
+                                                   fields='items(name,metadata),nextPageToken')
+                if blob.name.endswith('.json')]
+
+    # Both prefixes are listed concurrently; completed/ is applied last so
+    # its records win, matching the lookup order
+    prefixes = ['drafts/', 'completed/']
+    for prefix, blobs in zip(prefixes, list(io_pool.map(list_records, prefixes))):
+        # Records written with metadata carry their task id in it; only
+        # older ones have to be downloaded and parsed
+        found, unlabeled = [], []
+        for blob in blobs:
+            metadata = blob.metadata or {}
+            if 'clickup_task_id' in metadata:
+                found.append((blob, metadata['clickup_task_id']))
+            else:
+                unlabeled.append(blob)
+        for blob, article in zip(unlabeled, io_pool.map(load_json_blob, unlabeled)):
+            found.append((blob, article and article_clickup_task_id(article)))
+        for blob, task_id in found:
+            if task_id:
+                scanned[task_id] = blob.name[len(prefix):-len('.json')]
+
+    # Entries written while scanning are newer than what the scan saw
+    index, _ = mutate_json_blob(bucket.blob(CLICKUP_INDEX_BLOB), lambda index: {
+        'complete': True, 'tasks': {**scanned, **index.get('tasks', {})}}, dict)
+    _clickup_index = index['tasks']
+    return _clickup_index
+
+
 @app.route('/api/clickup/backfill', methods=['GET'])
 def clickup_backfill():
     """One-off backfill: create a NEW CONTENT ClickUp task for any saved article
@@ -2274,28 +3214,21 @@ def clickup_backfill():
     Dry-run by default - lists what WOULD be created. Pass ?confirm=true to
     actually create the tasks and write the new IDs back into each draft.
     """
-    if not gcs_client:
+    bucket = get_gcs_bucket()
+    if bucket is None:
         return jsonify({'success': False, 'error': 'GCS not available'}), 503
     if not CLICKUP_LIST_ID or not CLICKUP_API_TOKEN:
         return jsonify({'success': False, 'error': 'ClickUp not configured'}), 400
 
     confirm = request.args.get('confirm', '').lower() == 'true'
-    bucket = gcs_client.bucket(GCS_BUCKET_NAME)
 
     candidates, created, failed, skipped = [], [], [], []
 
     for prefix in ['drafts/', 'completed/']:
-        for blob in bucket.list_blobs(prefix=prefix):
-            if not blob.name.endswith('.json'):
-                continue
-            try:
-                article = json.loads(blob.download_as_text())
-            except Exception:
-                continue
-
+        # metadata too: records re-uploaded below keep their list summary
+        for blob, article in iter_json_records(bucket, prefix, 'items(name,metadata),nextPageToken'):
             data = article.get('data', {}) or {}
-            # task id is persisted inside data; check top-level too just in case
-            if data.get('clickup_task_id') or article.get('clickup_task_id'):
+            if article_clickup_task_id(article):
                 continue  # already has a task
 
             headline = (data.get('topic') or {}).get('headline')
@@ -2315,8 +3248,10 @@ def clickup_backfill():
                 if task_id:
                     data['clickup_task_id'] = task_id
                     article['data'] = data
-                    blob.upload_from_string(json.dumps(article, indent=2),
+                    set_summary_metadata(blob, article)
+                    blob.upload_from_string(orjson.dumps(article),
                                             content_type='application/json')
+                    index_clickup_task(bucket, task_id, blob.name[len(prefix):-len('.json')])
                     label['task_id'] = task_id
                     created.append(label)
                 else:
@@ -2342,26 +3277,20 @@ def clickup_relink():
     (same mechanism the normal create flow uses). Tasks that already have a doc
     link are skipped. Dry-run unless ?confirm=true.
     """
-    if not gcs_client:
+    bucket = get_gcs_bucket()
+    if bucket is None:
         return jsonify({'success': False, 'error': 'GCS not available'}), 503
     if not CLICKUP_LIST_ID or not CLICKUP_API_TOKEN:
         return jsonify({'success': False, 'error': 'ClickUp not configured'}), 400
 
     confirm = request.args.get('confirm', '').lower() == 'true'
-    bucket = gcs_client.bucket(GCS_BUCKET_NAME)
     targets, done, failed, skipped = [], [], [], []
 
     for prefix in ['drafts/', 'completed/']:
-        for blob in bucket.list_blobs(prefix=prefix):
-            if not blob.name.endswith('.json'):
-                continue
-            try:
-                article = json.loads(blob.download_as_text())
-            except Exception:
-                continue
-
+        # metadata too: records re-uploaded below keep their list summary
+        for blob, article in iter_json_records(bucket, prefix, 'items(name,metadata),nextPageToken'):
             data = article.get('data', {}) or {}
-            task_id = data.get('clickup_task_id') or article.get('clickup_task_id')
+            task_id = article_clickup_task_id(article)
             body = data.get('article')
             headline = (data.get('topic') or {}).get('headline')
             publication = article.get('publication')
@@ -2383,7 +3312,7 @@ def clickup_relink():
                     if m:
                         data['doc_url'] = m.group(0).rstrip(').,')
                         article['data'] = data
-                        blob.upload_from_string(json.dumps(article, indent=2),
+                        blob.upload_from_string(orjson.dumps(article),
                                                 content_type='application/json')
                 skipped.append({'task_id': task_id, 'title': headline,
                                 'reason': 'already linked in description'})
@@ -2409,7 +3338,7 @@ def clickup_relink():
             # Persist the url, then add the link to the task description
             data['doc_url'] = new_url
             article['data'] = data
-            blob.upload_from_string(json.dumps(article, indent=2), content_type='application/json')
+            blob.upload_from_string(orjson.dumps(article), content_type='application/json')
 
             new_desc = (desc + f"\n\nDraft: {new_url}") if desc else f"Draft: {new_url}"
             clickup_request('PUT', f'/task/{task_id}', {'description': new_desc})
@@ -2471,36 +3400,53 @@ def clickup_list_tasks():
 # ===================
 
 def find_article_by_clickup_task_id(task_id):
-    """Search completed/ then drafts/ in GCS for article with matching clickup_task_id"""
-    if not gcs_client or not task_id:
+    """Look up the article for a ClickUp task in the task index, then read
+    it from completed/ or, failing that, drafts/"""
+    bucket = get_gcs_bucket()
+    if bucket is None or not task_id:
         return None
-    bucket = gcs_client.bucket(GCS_BUCKET_NAME)
-    for prefix in ['completed/', 'drafts/']:
-        for blob in bucket.list_blobs(prefix=prefix):
-            try:
-                article = json.loads(blob.download_as_text())
-                # task id is persisted at data.clickup_task_id; check top-level too
-                stored = (article.get('data', {}) or {}).get('clickup_task_id') or article.get('clickup_task_id')
-                if stored == task_id:
+    # This process's copy of the index first; re-read it only when the task
+    # isn't there or its entry no longer leads to the task's record
+    tasks, fresh = _clickup_index, False
+    if tasks is None:
+        tasks, fresh = load_clickup_index(bucket), True
+    while True:
+        article_id = tasks.get(task_id)
+        if article_id:
+            # Both locations at once; completed/ wins if the record is in both
+            candidates = [bucket.blob(f"{prefix}{article_id}.json") for prefix in ['completed/', 'drafts/']]
+            for article in io_pool.map(load_json_blob, candidates):
+                if article and article_clickup_task_id(article) == task_id:
                     return article
-            except Exception:
-                continue
-    return None
+        if fresh:
+            return None
+        tasks, fresh = load_clickup_index(bucket), True
+
 
+# Identical reminders created within this window collapse into one, so a
+# burst of status flips on the same task doesn't stack duplicate tasks
+TODOIST_DEDUPE_SECONDS = 5
+_todoist_recent = {}  # content -> expires_at
+_todoist_recent_lock = threading.Lock()
 
 def create_todoist_task(content):
     """Create a task in Todoist"""
     if not TODOIST_API_TOKEN:
         print("[TODOIST] Skipped: no API token configured")
         return
+    now = time.time()
+    with _todoist_recent_lock:
+        if _todoist_recent.get(content, 0) > now:
+            print(f"[TODOIST] Skipped duplicate: {content}")
+            return
+        for key in [key for key, expires_at in _todoist_recent.items() if expires_at <= now]:
+            del _todoist_recent[key]
+        _todoist_recent[content] = now + TODOIST_DEDUPE_SECONDS
     payload = {'content': content}
     if TODOIST_PROJECT_ID:
         payload['project_id'] = TODOIST_PROJECT_ID
-    resp = http_requests.post(
-        'https://api.todoist.com/api/v1/tasks',
-        headers={'Authorization': f'Bearer {TODOIST_API_TOKEN}', 'Content-Type': 'application/json'},
-        json=payload
-    )
+    resp = http_session.post(TODOIST_TASKS_URL, headers=TODOIST_HEADERS, data=orjson.dumps(payload),
+                             timeout=(3, 10))
     if resp.ok:
         print(f"[TODOIST] Created task: {content}")
     else:
@@ -2525,11 +3471,8 @@ def todoist_test():
         payload = {'content': 'TEST - Todoist integration working!'}
         if TODOIST_PROJECT_ID:
             payload['project_id'] = TODOIST_PROJECT_ID
-        resp = http_requests.post(
-            'https://api.todoist.com/api/v1/tasks',
-            headers={'Authorization': f'Bearer {TODOIST_API_TOKEN}', 'Content-Type': 'application/json'},
-            json=payload
-        )
+        resp = http_session.post(TODOIST_TASKS_URL, headers=TODOIST_HEADERS, data=orjson.dumps(payload),
+                                 timeout=(3, 10))
         if resp.ok:
             try:
                 task_data = resp.json()
@@ -2542,7 +3485,44 @@ def todoist_test():
         return jsonify({'success': False, 'error': str(e), 'token_len': len(TODOIST_API_TOKEN), 'project_id': TODOIST_PROJECT_ID})
 
 
+# Title and publication per task. Webhooks for the same task (several
+# status changes, ClickUp retries) arrive close together, and neither field
+# changes with the status, so they're reused for a few minutes.
+CLICKUP_TASK_INFO_TTL = 5 * 60
+CLICKUP_TASK_INFO_MAX = 1024
+_clickup_task_info = {}  # task_id -> (expires_at, (title, publication))
+
 def get_clickup_task_info(task_id):
+    """Task title and publication, from the short-lived cache or the ClickUp API"""
+    cached = _clickup_task_info.get(task_id)
+    if cached and cached[0] > time.time():
+        return cached[1]
+
+    info = fetch_clickup_task_info(task_id)
+    if info[0] is not None:
+        if len(_clickup_task_info) >= CLICKUP_TASK_INFO_MAX:
+            now = time.time()
+            for key in [key for key, (expires_at, _) in _clickup_task_info.items() if expires_at <= now]:
+                _clickup_task_info.pop(key, None)
+        if len(_clickup_task_info) < CLICKUP_TASK_INFO_MAX:
+            _clickup_task_info[task_id] = (time.time() + CLICKUP_TASK_INFO_TTL, info)
+    return info
+
+def clickup_publication_field(task_data):
+    """The task's Publication custom field and its option names by
+    orderindex, or (None, {}). The options come from the task payload itself,
+    so renamed or reordered options apply right away."""
+    for field in task_data.get('custom_fields', []):
+        if field.get('name', '').lower() == 'publication':
+            # Dropdown/label type field
+            type_config = field.get('type_config', {})
+            return field, {opt['orderindex']: opt['name'] for opt in type_config.get('options', [])}
+    return None, {}
+
+# "[Forbes] headline" -> ("Forbes", "headline")
+_PUB_PREFIX_RE = re.compile(r'\[([^\]]*)\]\s*(.*?)\s*$', re.DOTALL)
+
+def fetch_clickup_task_info(task_id):
     """Fetch task details from ClickUp API (title, publication custom field)"""
     ok, data = clickup_request('GET', f'/task/{task_id}')
     if not ok:
@@ -2552,23 +3532,19 @@ def get_clickup_task_info(task_id):
     publication = None
 
     # Check custom fields for "Publication"
-    for field in data.get('custom_fields', []):
-        if field.get('name', '').lower() == 'publication':
-            # Dropdown/label type field
-            type_config = field.get('type_config', {})
-            options = {opt['orderindex']: opt['name'] for opt in type_config.get('options', [])}
-            value = field.get('value')
-            if isinstance(value, int):
-                publication = options.get(value)
-            elif isinstance(value, str):
-                publication = value
-            break
+    field, options = clickup_publication_field(data)
+    if field:
+        value = field.get('value')
+        if isinstance(value, int):
+            publication = options.get(value)
+        elif isinstance(value, str):
+            publication = value
 
     # Fallback: parse pub name from title prefix like "[Forbes] headline"
-    if not publication and title.startswith('['):
-        bracket_end = title.find(']')
-        if bracket_end > 0:
-            publication = title[1:bracket_end]
+    if not publication:
+        prefixed = _PUB_PREFIX_RE.match(title)
+        if prefixed:
+            publication = prefixed.group(1)
 
     print(f"[CLICKUP] Task info: title={title}, publication={publication}")
     return title, publication
@@ -2578,19 +3554,94 @@ def get_clickup_task_info(task_id):
 # ClickUp Webhook
 # ===================
 
+# Statuses that should create a Todoist "time to record" reminder
+TODOIST_STATUS_PHRASES = {
+    'submited': 'submitted',          # ClickUp status "SUBMITED"
+    'not submitting': 'not submitting',  # ClickUp status "NOT SUBMITTING"
+    'rejected': 'rejected',           # ClickUp status "REJECTED"
+}
+
+# Webhook work runs here after ClickUp has been answered, so a slow GCS or
+# Todoist call can't push the reply past ClickUp's timeout and trigger a
+# retry. Separate from io_pool because the work itself fans out onto it.
+webhook_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='webhook')
+
+# ClickUp redelivers an event it thinks failed; each history item id is only
+# acted on once. Redis makes that hold across workers; without it each
+# process remembers the ids it has seen.
+WEBHOOK_DEDUPE_TTL = 60 * 60
+_webhook_events_seen = {}  # event id -> expires_at
+_webhook_events_lock = threading.Lock()
+
+def first_webhook_delivery(event_id: str) -> bool:
+    """True unless event_id was already handled within WEBHOOK_DEDUPE_TTL"""
+    if redis_client is not None:
+        try:
+            return bool(redis_client.set(f"clickup-webhook:{event_id}", 1, nx=True, ex=WEBHOOK_DEDUPE_TTL))
+        except Exception as e:
+            print(f"[WARNING] Redis unavailable for webhook dedupe: {e}")
+    now = time.time()
+    with _webhook_events_lock:
+        if _webhook_events_seen.get(event_id, 0) > now:
+            return False
+        if len(_webhook_events_seen) >= 4096:
+            for key in [key for key, expires_at in _webhook_events_seen.items() if expires_at <= now]:
+                del _webhook_events_seen[key]
+        _webhook_events_seen[event_id] = now + WEBHOOK_DEDUPE_TTL
+    return True
+
+def process_status_change(task_id, new_status):
+    """Create the Todoist reminder for a task that moved to new_status"""
+    try:
+        # Resolve title + publication: GCS draft first, then fall back to ClickUp
+        # API. The ClickUp lookup runs alongside the GCS one so a miss doesn't
+        # pay for both round-trips in sequence.
+        task_info = io_pool.submit(get_clickup_task_info, task_id)
+        article = find_article_by_clickup_task_id(task_id)
+        if article:
+            pub_name = get_pub_display_name(article.get('publication', ''))
+            title = article.get('data', {}).get('topic', {}).get('headline', '')
+        else:
+            title, pub = task_info.result()
+            pub_name = pub or 'Article'
+            title = title or ''
+            # Strip [Pub Name] prefix from title if present
+            prefixed = _PUB_PREFIX_RE.match(title)
+            if prefixed:
+                title = prefixed.group(2)
+
+        create_todoist_task(f"{pub_name} article {TODOIST_STATUS_PHRASES[new_status]} ({title}) - time to record")
+    except Exception as e:
+        print(f"[CLICKUP WEBHOOK] Failed to process {task_id} -> {new_status}: {e}")
+
 @app.route('/api/clickup/webhook', methods=['POST'])
 def clickup_webhook():
     """Receive ClickUp task status change webhooks"""
-    data = request.json or {}
+    raw = request.get_data(cache=False)
+    if CLICKUP_WEBHOOK_SECRET:
+        # X-Signature is the hex HMAC-SHA256 of the body as sent
+        expected = hmac.new(CLICKUP_WEBHOOK_SECRET.encode(), raw, hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(request.headers.get('X-Signature', ''), expected):
+            print("[CLICKUP WEBHOOK] Rejected delivery with a bad or missing signature")
+            return jsonify({'ok': False, 'error': 'Invalid signature'}), 401
+
+    try:
+        data = orjson.loads(raw) if raw else {}
+    except orjson.JSONDecodeError:
+        return jsonify({'ok': False, 'error': 'Invalid JSON'}), 400
+    if not isinstance(data, dict):
+        data = {}
 
     if data.get('event') != 'taskStatusUpdated':
         return jsonify({'ok': True})
 
     # Extract new status from history_items
     new_status = None
+    event_id = None
     for item in data.get('history_items', []):
         if item.get('field') == 'status':
             new_status = (item.get('after', {}).get('status') or '').lower()
+            event_id = item.get('id')
             break
 
     if not new_status:
@@ -2599,28 +3650,11 @@ def clickup_webhook():
     task_id = data.get('task_id')
     print(f"[CLICKUP WEBHOOK] task_id={task_id} new_status={new_status}")
 
-    # Statuses that should create a Todoist "time to record" reminder
-    todoist_phrases = {
-        'submited': 'submitted',          # ClickUp status "SUBMITED"
-        'not submitting': 'not submitting',  # ClickUp status "NOT SUBMITTING"
-        'rejected': 'rejected',           # ClickUp status "REJECTED"
-    }
-
-    if new_status in todoist_phrases:
-        # Resolve title + publication: GCS draft first, then fall back to ClickUp API
-        article = find_article_by_clickup_task_id(task_id)
-        if article:
-            pub_name = get_pub_display_name(article.get('publication', ''))
-            title = article.get('data', {}).get('topic', {}).get('headline', '')
+    if new_status in TODOIST_STATUS_PHRASES:
+        if event_id and not first_webhook_delivery(str(event_id)):
+            print(f"[CLICKUP WEBHOOK] Ignoring redelivered event {event_id}")
         else:
-            title, pub = get_clickup_task_info(task_id)
-            pub_name = pub or 'Article'
-            title = title or ''
-            # Strip [Pub Name] prefix from title if present
-            if title.startswith('[') and ']' in title:
-                title = title[title.index(']') + 1:].strip()
-
-        create_todoist_task(f"{pub_name} article {todoist_phrases[new_status]} ({title}) - time to record")
+            webhook_pool.submit(process_status_change, task_id, new_status)
 
     return jsonify({'ok': True})
 
@@ -2629,19 +3663,20 @@ def clickup_webhook():
 # Health Check
 # ===================
 
+# Probes hit this every few seconds; only the timestamp changes per call
+_HEALTH_BODY = b'{"status":"healthy","timestamp":"%s","version":"1.0.0"}'
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
-        'version': '1.0.0'
-    })
+    return Response(_HEALTH_BODY % datetime.now().isoformat().encode(), mimetype='application/json')
 
 # ===================
 # Run Application
 # ===================
 
+# Local development only - deployments serve app:app from gunicorn's gevent
+# workers (see Procfile)
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     debug = os.environ.get('FLASK_DEBUG', '1') == '1'
@@ -0,0 +1,53 @@
+import pytest
+
+import app as app_module
+
+
+REFINED = {"headline": "Refined", "angle": "Refined angle", "timeliness": "Now", "briteco_connection": "BriteCo"}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    calls = []
+
+    def fake_tool_call(name, prompt, tool, **kwargs):
+        calls.append(name)
+        return dict(REFINED)
+
+    monkeypatch.setattr(app_module, 'claude_tool_call', fake_tool_call)
+    test_client = app_module.app.test_client()
+    with test_client.session_transaction() as session:
+        session['user'] = {'email': 'editor@brite.co'}
+    test_client.claude_calls = calls
+    return test_client
+
+
+def refine(client, publication, headline):
+    resp = client.post('/api/refine-topic', json={
+        'publication': publication, 'headline': headline, 'angle': 'An angle'})
+    assert resp.status_code == 200
+    return resp.get_json()['topic']
+
+
+@pytest.mark.parametrize('publication, headline', [
+    ('forbes', 'how i built a company lol'),
+    ('forbes', 'why bitcoin is dumb i think ok'),
+    ('forbes', 'How I Built A Company From Nothing Really'),  # "How [Topic] + Question" is too loose
+    ('forbes', 'How to build trust with remote teams fast'),  # not title case
+    ('fastcompany', 'is the fear of failure keeping you stuck?'),
+])
+def test_unpolished_headline_goes_to_claude(client, publication, headline):
+    topic = refine(client, publication, headline)
+    assert client.claude_calls == ['refine_topic']
+    assert topic['headline'] == 'Refined'
+
+
+@pytest.mark.parametrize('publication, headline', [
+    ('forbes', 'How To Build Trust With Remote Teams'),
+    ('forbes', "Why Bitcoin Isn't Dumb For Small Businesses"),
+    ('fastcompany', 'Is the fear of failure keeping you stuck?'),
+])
+def test_headline_that_fits_the_guide_skips_claude(client, publication, headline):
+    topic = refine(client, publication, headline)
+    assert client.claude_calls == []
+    assert topic['headline'] == headline